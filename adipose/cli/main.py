@@ -6,16 +6,20 @@ from pathlib import Path
 from typing import Optional
 
 from adipose.core.generator import load_config, validate_config
+from adipose.core.indexes import format_index_report
+from adipose.core.seed import SEED_FORMATS, write_seed_data
 from adipose.generators.backend.django_generator import DjangoGenerator
 from adipose.generators.backend.express_generator import ExpressGenerator
 from adipose.generators.backend.dotnet_generator import DotNetGenerator
 from adipose.generators.backend.springboot_generator import SpringBootGenerator
+from adipose.generators.backend.springboot_reactive_generator import ReactiveSpringBootGenerator
 from adipose.generators.backend.laravel_generator import LaravelGenerator
 from adipose.generators.frontend.javascript_generator import JavaScriptGenerator
 from adipose.generators.frontend.flutter_generator import FlutterGenerator
 from adipose.generators.frontend.swift_generator import SwiftGenerator
 from adipose.generators.frontend.kotlin_generator import KotlinGenerator
 from adipose.generators.frontend.avaloniaui_generator import AvaloniaUIGenerator
+from adipose.generators.tools.loadtest_generator import LoadTestGenerator
 
 
 BACKEND_GENERATORS = {
@@ -23,6 +27,7 @@ BACKEND_GENERATORS = {
     'express': ExpressGenerator,
     'dotnet': DotNetGenerator,
     'springboot': SpringBootGenerator,
+    'springboot-reactive': ReactiveSpringBootGenerator,
     'laravel': LaravelGenerator,
 }
 
@@ -48,17 +53,22 @@ def cli():
 @click.option('--backend', '-b', type=click.Choice(list(BACKEND_GENERATORS.keys())), help='Backend framework')
 @click.option('--frontend', '-f', type=click.Choice(list(FRONTEND_GENERATORS.keys())), help='Frontend framework')
 @click.option('--output', '-o', required=True, type=click.Path(), help='Output directory')
-def generate(config: str, backend: Optional[str], frontend: Optional[str], output: str):
+@click.option('--previous', '-p', type=click.Path(exists=True),
+              help='Previous configuration file; migrations are generated from the diff')
+@click.option('--loadtest', is_flag=True, help='Also generate a load-test harness for the endpoints')
+def generate(config: str, backend: Optional[str], frontend: Optional[str], output: str,
+             previous: Optional[str], loadtest: bool):
     """Generate code from configuration."""
     
-    if not backend and not frontend:
-        click.echo("Error: Specify at least --backend or --frontend", err=True)
+    if not backend and not frontend and not loadtest:
+        click.echo("Error: Specify at least --backend, --frontend or --loadtest", err=True)
         sys.exit(1)
     
     try:
         # Load and validate config
         click.echo(f"Loading configuration from {config}...")
         api_config = load_config(config)
+        previous_config = load_config(previous) if previous else None
         click.echo("✓ Configuration loaded successfully\n")
         
         # Generate backend
@@ -66,7 +76,7 @@ def generate(config: str, backend: Optional[str], frontend: Optional[str], outpu
             backend_output = Path(output) / 'backend'
             click.echo(f"Generating {backend} backend to {backend_output}...")
             generator_class = BACKEND_GENERATORS[backend]
-            generator = generator_class(api_config, str(backend_output))
+            generator = generator_class(api_config, str(backend_output), previous_config)
             generator.generate()
         
         # Generate frontend
@@ -77,6 +87,13 @@ def generate(config: str, backend: Optional[str], frontend: Optional[str], outpu
             generator = generator_class(api_config, str(frontend_output))
             generator.generate()
         
+        # Generate load-test harness
+        if loadtest:
+            loadtest_output = Path(output) / 'loadtest'
+            click.echo(f"\nGenerating load-test harness to {loadtest_output}...")
+            generator = LoadTestGenerator(api_config, str(loadtest_output), backend)
+            generator.generate()
+        
         click.echo("\n✓ Code generation complete!")
         click.echo(f"\nOutput directory: {output}")
         
@@ -96,6 +113,59 @@ def validate(config: str):
         sys.exit(1)
 
 
+@cli.command()
+@click.option('--config', '-c', required=True, type=click.Path(exists=True), help='Configuration file path')
+def indexes(config: str):
+    """Show the indexes derived from filters, sort fields and constraints."""
+    try:
+        click.echo(format_index_report(load_config(config)))
+    except Exception as e:
+        click.echo(f"✗ Error: {str(e)}", err=True)
+        sys.exit(1)
+
+
+@cli.command()
+@click.option('--config', '-c', required=True, type=click.Path(exists=True), help='Configuration file path')
+@click.option('--rows', '-n', multiple=True,
+              help='Rows per model (default: 1000), or per model with Model=ROWS; repeatable')
+@click.option('--format', '-f', 'fmt', type=click.Choice(SEED_FORMATS), default='copy', help='Output format')
+@click.option('--output', '-o', required=True, type=click.Path(),
+              help='Output directory (or SQLite database file for --format sqlite)')
+@click.option('--seed', type=int, default=0, help='Random seed; the same seed produces the same data')
+@click.option('--table-prefix', default='', help="Prefix for default table names (e.g. 'api_' for Django)")
+@click.option('--batch-size', type=int, default=10000, help='Rows buffered per write')
+def seed(config: str, rows: tuple, fmt: str, output: str, seed: int, table_prefix: str, batch_size: int):
+    """Generate synthetic seed data that satisfies the model constraints."""
+    try:
+        api_config = load_config(config)
+        row_counts = {}
+        # Models not named with Model=ROWS get the bare count, or 1000 without one
+        default_rows = 1000
+        for value in rows:
+            model_name, _, count = value.rpartition('=')
+            if model_name:
+                if model_name not in api_config.models:
+                    raise click.BadParameter(f"Unknown model '{model_name}'", param_hint='--rows')
+                row_counts[model_name] = int(count)
+            else:
+                default_rows = int(count)
+        for model_name in api_config.models:
+            row_counts.setdefault(model_name, default_rows)
+        
+        def report(stats):
+            rate = stats['rows'] / stats['seconds'] if stats['seconds'] else 0
+            click.echo(f"  {stats['table']}: {stats['rows']:,} rows in {stats['seconds']:.1f}s ({rate:,.0f} rows/s)")
+        
+        click.echo(f"Seeding {fmt} data to {output}...")
+        tables = write_seed_data(api_config, output, row_counts, fmt, seed, table_prefix, batch_size, report)
+        click.echo(f"\n✓ Seeded {sum(t['rows'] for t in tables):,} rows")
+        if fmt == 'copy':
+            click.echo(f"\nLoad with: cd {output} && psql -f load.sql")
+    except Exception as e:
+        click.echo(f"✗ Error: {str(e)}", err=True)
+        sys.exit(1)
+
+
 @cli.command('list-platforms')
 def list_platforms():
     """List supported backend and frontend platforms."""
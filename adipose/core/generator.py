@@ -13,14 +13,16 @@ from adipose.schemas.config import APIConfig
 class CodeGenerator:
     """Base code generator class."""
     
-    def __init__(self, config: APIConfig, output_dir: str):
+    def __init__(self, config: APIConfig, output_dir: str, previous_config: Optional[APIConfig] = None):
         """Initialize code generator.
         
         Args:
             config: API configuration
             output_dir: Output directory for generated code
+            previous_config: Configuration the existing deployment was generated from, if any
         """
         self.config = config
+        self.previous_config = previous_config
         self.output_dir = Path(output_dir)
         self.templates_dir = Path(__file__).parent.parent / "templates"
         
@@ -39,7 +41,8 @@ class CodeGenerator:
         """Setup custom Jinja2 filters."""
         from adipose.utils.helpers import (
             to_snake_case, to_camel_case, to_pascal_case, to_kebab_case,
-            pluralize, singularize, type_mapping, get_http_method, get_endpoint_path
+            pluralize, singularize, type_mapping, get_http_method, get_endpoint_path,
+            index_name, relation_name
         )
         
         self.jinja_env.filters['snake_case'] = to_snake_case
@@ -51,6 +54,8 @@ class CodeGenerator:
         self.jinja_env.filters['type_map'] = type_mapping
         self.jinja_env.filters['http_method'] = get_http_method
         self.jinja_env.filters['endpoint_path'] = get_endpoint_path
+        self.jinja_env.filters['index_name'] = index_name
+        self.jinja_env.filters['relation_name'] = relation_name
     
     def generate(self):
         """Generate code. Override in subclasses."""
@@ -116,6 +121,8 @@ class CodeGenerator:
             'database': self.config.database,
             'cors': self.config.cors,
             'error_handling': self.config.error_handling,
+            'performance': self.config.performance,
+            'metrics': self.config.metrics,
         }
 
 
@@ -0,0 +1,184 @@
+"""Database index derivation for Adipose models."""
+
+from typing import Dict, List, Literal, Optional, Tuple
+from pydantic import BaseModel, Field
+
+from adipose.schemas.config import APIConfig
+from adipose.utils.helpers import index_name
+
+
+PARTIAL_INDEX_DATABASES = ("postgresql", "sqlite")
+
+
+class IndexSpec(BaseModel):
+    """Backend-neutral index definition."""
+    name: str = Field(..., description="Index name")
+    fields: List[str] = Field(..., description="Indexed columns, in order")
+    condition: Optional[Literal["live", "deleted"]] = Field(
+        default=None, description="Restrict a partial index to live or soft-deleted rows"
+    )
+    unique: bool = Field(default=False, description="Index backing a unique constraint or primary key")
+    serves: List[str] = Field(default_factory=list, description="Queries and constraints the index serves")
+
+
+def get_table_name(config: APIConfig, model_name: str) -> str:
+    """Get the database table name used for a model in index names."""
+    return config.models[model_name].table_name or model_name.lower()
+
+
+def get_columns(config: APIConfig, model_name: str) -> List[str]:
+    """Get every column of a model, including implicit ones."""
+    model = config.models[model_name]
+    columns = ["id"] + [name for name in model.fields if name != "id"]
+    if model.timestamps:
+        columns += ["created_at", "updated_at"]
+    if model.soft_delete:
+        columns.append("deleted_at")
+    return columns
+
+
+def model_indexes(config: APIConfig, model_name: str, include_constraints: bool = False) -> List[IndexSpec]:
+    """Plan the secondary indexes for a model.
+
+    Candidates come from foreign keys, `index` flags, the range partition key
+    followed by id (the list order of range-partitioned models) and, for every
+    endpoint serving the model, each filter alone, each sort field alone, each
+    filter followed by each sort field when the endpoint sets
+    filter_sort_indexes (unless the filter is unique), and updated_at followed
+    by id for delta sync. Cursor-paginated endpoints append id to every sorted
+    index, the tiebreaker of their keyset. Candidates already
+    covered by a unique constraint or by the leading columns of a wider index
+    are folded into it; an index on all rows also covers a live-rows one.
+
+    Args:
+        config: API configuration
+        model_name: Name of the model
+        include_constraints: Also return the indexes backing the primary key and
+            unique fields, which backends create from the field definitions
+
+    Returns:
+        Index definitions with the queries each one serves
+    """
+    model = config.models[model_name]
+    table = get_table_name(config, model_name)
+    columns = get_columns(config, model_name)
+    constrained = ["id"] + [name for name, field in model.fields.items() if field.unique and name != "id"]
+    query_condition = "live" if model.soft_delete else None
+    candidates: Dict[Tuple, List[str]] = {}
+
+    def add(fields: List[str], condition: Optional[str], reason: str):
+        if any(field_name not in columns for field_name in fields):
+            return
+        reasons = candidates.setdefault((condition, tuple(fields)), [])
+        if reason not in reasons:
+            reasons.append(reason)
+
+    for field_name, field in model.fields.items():
+        if field.foreign_key:
+            add([field_name], None, f"foreign key to {field.foreign_key}")
+        if field.index:
+            add([field_name], None, "index flag")
+
+    partition = model.partition_by
+    if partition and partition.strategy == "range":
+        add([partition.key, "id"], None, "partition key: newest-first list order")
+
+    for endpoint in config.endpoints:
+        if endpoint.model != model_name:
+            continue
+        sort_fields = endpoint.sort_fields or []
+        tiebreak = ["id"] if endpoint.pagination_mode == "cursor" else []
+        for filter_field in endpoint.filters or []:
+            # An equality match on a unique column returns one row, so sorting needs no index
+            paired = endpoint.filter_sort_indexes and filter_field not in constrained
+            for sort_field in (sort_fields if paired else []):
+                if sort_field != filter_field:
+                    add([filter_field, sort_field] + (tiebreak if sort_field != "id" else []), query_condition,
+                        f"{endpoint.resource}: filter {filter_field}, sort {sort_field}")
+            add([filter_field], query_condition, f"{endpoint.resource}: filter {filter_field}")
+        for sort_field in sort_fields:
+            add([sort_field] + (tiebreak if sort_field != "id" else []), query_condition,
+                f"{endpoint.resource}: sort {sort_field}")
+        if "changes" in endpoint.operations:
+            # Delta sync reads tombstones too, so this index is not partial
+            add(["updated_at", "id"], None, f"{endpoint.resource}: changes since a sync token")
+
+    # Fold each candidate into a unique constraint or a wider index on the same leading columns.
+    # Narrow candidates go first, and live ones before full ones of the same width, so reasons
+    # folded into an index travel on with it when that index is folded in turn.
+    covered = set()
+    constraint_reasons: Dict[str, List[str]] = {name: [] for name in constrained}
+    for condition, fields in sorted(candidates, key=lambda key: (len(key[1]), key[0] is None)):
+        reasons = candidates[(condition, fields)]
+        if len(fields) == 1 and fields[0] in constrained and condition in (None, "live"):
+            constraint_reasons[fields[0]].extend(
+                reason for reason in reasons if reason not in constraint_reasons[fields[0]]
+            )
+            covered.add((condition, fields))
+            continue
+        for other_condition, other in candidates:
+            if other == fields and other_condition == condition:
+                continue
+            if (other_condition in (condition, None) and len(other) >= len(fields)
+                    and other[:len(fields)] == fields and (other_condition, other) not in covered):
+                candidates[(other_condition, other)].extend(
+                    reason for reason in reasons if reason not in candidates[(other_condition, other)]
+                )
+                covered.add((condition, fields))
+                break
+
+    partial = config.database.type in PARTIAL_INDEX_DATABASES
+    indexes = []
+    if include_constraints:
+        for field_name in constrained:
+            label = "primary key" if field_name == "id" else "unique constraint"
+            indexes.append(IndexSpec(
+                name=index_name(table, [field_name], "pk" if field_name == "id" else "uniq"),
+                fields=[field_name],
+                unique=True,
+                serves=[label] + constraint_reasons[field_name],
+            ))
+    for (condition, fields), reasons in candidates.items():
+        if (condition, fields) in covered:
+            continue
+        name = index_name(table, list(fields), "live" if condition == "live" else "idx")
+        if condition == "live" and not partial:
+            # Without partial indexes, lead with deleted_at so live rows form one range
+            fields, condition = ("deleted_at",) + fields, None
+        indexes.append(IndexSpec(name=name, fields=list(fields), condition=condition, serves=reasons))
+
+    if model.soft_delete:
+        indexes.append(IndexSpec(
+            name=index_name(table, ["deleted_at"], "tomb"),
+            fields=["deleted_at"],
+            condition="deleted" if partial else None,
+            serves=["purge_deleted: soft-deleted rows"],
+        ))
+
+    return indexes
+
+
+def format_index_report(config: APIConfig) -> str:
+    """Render the planned indexes of every model as a Markdown report.
+
+    Args:
+        config: API configuration
+
+    Returns:
+        Markdown tables listing each index and what it serves
+    """
+    lines = [f"# Index Plan ({config.database.type})", ""]
+    for model_name in config.models:
+        lines += [
+            f"## {model_name}",
+            "",
+            "| Index | Columns | Rows | Serves |",
+            "|-------|---------|------|--------|",
+        ]
+        for index in model_indexes(config, model_name, include_constraints=True):
+            rows = {"live": "deleted_at IS NULL", "deleted": "deleted_at IS NOT NULL"}.get(index.condition, "all")
+            lines.append(
+                f"| {index.name} | {', '.join(index.fields)} | {rows} | {'; '.join(index.serves)} |"
+            )
+        lines.append("")
+    return "\n".join(lines)
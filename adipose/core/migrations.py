@@ -0,0 +1,346 @@
+"""Schema migration planning for Adipose configurations."""
+
+from typing import Dict, List, Literal, Optional
+from pydantic import BaseModel, Field
+
+from adipose.core.indexes import IndexSpec, model_indexes
+from adipose.schemas.config import APIConfig, FieldConfig, ModelConfig
+
+
+# Attributes that only affect validation or documentation, never the schema
+NON_SCHEMA_ATTRIBUTES = {"description", "min_length", "min_value", "max_value", "pattern", "index"}
+
+# Python literals used to fill existing rows when adding NOT NULL columns
+ONE_OFF_DEFAULTS = {
+    "string": "''",
+    "text": "''",
+    "integer": "0",
+    "float": "0.0",
+    "boolean": "False",
+    "datetime": "timezone.now",
+}
+
+# Expressions giving every existing row a distinct value, derived from its primary key
+UNIQUE_BACKFILLS = {
+    "string": "Cast('pk', output_field=models.TextField())",
+    "text": "Cast('pk', output_field=models.TextField())",
+    "integer": "F('pk')",
+    "float": "Cast('pk', output_field=models.FloatField())",
+}
+
+
+class MigrationOperation(BaseModel):
+    """A single schema change and its estimated locking impact."""
+    action: Literal[
+        "create_model", "delete_model", "add_field", "backfill_field", "remove_field", "alter_field",
+        "add_index", "remove_index",
+    ] = Field(..., description="Kind of schema change")
+    model: str = Field(..., description="Affected model")
+    field: Optional[str] = Field(default=None, description="Affected field")
+    field_config: Optional[FieldConfig] = Field(
+        default=None, description="New field definition (None for implicit timestamp/soft-delete fields)"
+    )
+    one_off_default: Optional[str] = Field(
+        default=None, description="Constant used to fill existing rows when adding a NOT NULL column"
+    )
+    backfill: Optional[str] = Field(
+        default=None, description="Django expression filling existing rows with distinct values"
+    )
+    index: Optional[IndexSpec] = Field(default=None, description="Affected index")
+    concurrent: bool = Field(default=False, description="Run without blocking writes (non-atomic)")
+    lock: str = Field(default="", description="Lock taken on the table")
+    impact: Literal["none", "low", "medium", "high"] = Field(
+        default="low", description="Estimated impact on production traffic"
+    )
+    note: str = Field(default="", description="Explanation of the estimate")
+
+
+def _implicit_fields(model: ModelConfig) -> List[str]:
+    """Columns added by model options rather than declared fields."""
+    fields = []
+    if model.timestamps:
+        fields += ["created_at", "updated_at"]
+    if model.soft_delete:
+        fields.append("deleted_at")
+    return fields
+
+
+def _schema_attributes(field: FieldConfig) -> Dict:
+    return field.model_dump(exclude=NON_SCHEMA_ATTRIBUTES)
+
+
+def _add_column_cost(database_type: str, rebuilds_on_sqlite: bool):
+    """Estimate the lock and impact of adding a column without an index or constraint."""
+    if database_type == "postgresql":
+        return "brief exclusive (metadata only)", "low", "catalog-only on PostgreSQL 11+"
+    if database_type == "mysql":
+        return ("InnoDB online DDL", "medium",
+                "instant on MySQL 8.0.12+; older versions and some row formats rebuild the table")
+    if database_type == "sqlite":
+        if rebuilds_on_sqlite:
+            return "exclusive for the full rewrite", "medium", "SQLite recreates the table"
+        return "brief exclusive (metadata only)", "low", "plain ALTER TABLE ADD COLUMN"
+    return "exclusive", "medium", f"{database_type} may rewrite the table"
+
+
+def _add_field(model_name: str, field_name: str, field: Optional[FieldConfig],
+               database_type: str) -> List[MigrationOperation]:
+    """Plan a column addition, backfilling distinct values before a unique constraint is set."""
+    if field is not None and field.unique and (field.required or field.default is not None):
+        # A one-off default would give every existing row the same value
+        backfill = UNIQUE_BACKFILLS.get(field.type.lower())
+        if backfill is None or field.foreign_key:
+            raise ValueError(
+                f"cannot add required unique field {model_name}.{field_name} of type {field.type}: "
+                f"existing rows need distinct values; add it as an optional field first, "
+                f"fill it, then make it required"
+            )
+        lock, impact, note = _add_column_cost(database_type, rebuilds_on_sqlite=False)
+        return [
+            MigrationOperation(
+                action="add_field",
+                model=model_name,
+                field=field_name,
+                field_config=field.model_copy(update={"required": False, "unique": False, "default": None}),
+                lock=lock,
+                impact=impact,
+                note=f"added nullable, without its unique constraint: {note}",
+            ),
+            MigrationOperation(
+                action="backfill_field",
+                model=model_name,
+                field=field_name,
+                field_config=field,
+                backfill=backfill,
+                lock="row locks on every existing row",
+                impact="high",
+                note="one UPDATE gives existing rows distinct values derived from their id; replace them afterwards",
+            ),
+            MigrationOperation(
+                action="alter_field",
+                model=model_name,
+                field=field_name,
+                field_config=field,
+                lock="blocks writes while the unique index builds",
+                impact="high",
+                note="sets NOT NULL and UNIQUE; the unique index builds under lock"
+                     + ("; SQLite recreates the table" if database_type == "sqlite" else ""),
+            ),
+        ]
+
+    if field is None:
+        # created_at/updated_at are filled once, deleted_at is nullable
+        one_off = "timezone.now" if field_name != "deleted_at" else None
+    elif field.required and field.default is None:
+        one_off = ONE_OFF_DEFAULTS.get(field.type.lower())
+    else:
+        one_off = None
+
+    nullable = one_off is None and (field is None or (not field.required and field.default is None))
+    unique = field is not None and field.unique
+    lock, impact, note = _add_column_cost(database_type, rebuilds_on_sqlite=not nullable or unique)
+    if one_off is not None:
+        note = f"NOT NULL column filled with constant {one_off}: {note}"
+    elif not nullable:
+        note = f"column with a default: {note}"
+    else:
+        note = f"nullable column: {note}"
+    if unique:
+        lock, impact = "blocks writes while the unique index builds", "high"
+        note += "; the unique index builds under lock"
+    elif field is not None and field.foreign_key:
+        lock, impact = "blocks writes while the index and constraint build", "high"
+        note += "; the foreign key index builds and the constraint is checked under lock"
+    elif field is not None and field.index and database_type not in ("postgresql", "mysql"):
+        impact = "high"
+        note += f"; its index builds under lock ({database_type} has no online index build)"
+    return [MigrationOperation(
+        action="add_field",
+        model=model_name,
+        field=field_name,
+        field_config=field,
+        one_off_default=one_off,
+        lock=lock,
+        impact=impact,
+        note=note,
+    )]
+
+
+def _alter_field(model_name: str, field_name: str, old: FieldConfig, new: FieldConfig,
+                 database_type: str) -> MigrationOperation:
+    """Plan a column change and estimate whether it rewrites or scans the table."""
+    impact, lock, notes = "low", "brief exclusive (metadata only)", []
+
+    if old.type.lower() != new.type.lower():
+        impact, lock = "high", "exclusive for the full rewrite"
+        notes.append(f"type change {old.type} -> {new.type} rewrites the table")
+    if old.max_length != new.max_length:
+        if new.max_length is None or (old.max_length is not None and new.max_length > old.max_length):
+            notes.append("widening a varchar is catalog-only")
+        else:
+            impact, lock = "high", "exclusive for the full rewrite"
+            notes.append("narrowing a varchar rewrites the table")
+    if old.required and not new.required:
+        notes.append("dropping NOT NULL is catalog-only")
+    if new.required and not old.required:
+        notes.append("adding NOT NULL scans every row; backfill nulls first")
+        if impact != "high":
+            impact, lock = "medium", "exclusive during a full-table NOT NULL scan"
+    if new.unique and not old.unique:
+        impact = "high"
+        lock = "blocks writes while the unique index builds"
+        notes.append("unique constraint builds its index under lock")
+    if old.unique and not new.unique:
+        notes.append("dropping a unique constraint is catalog-only")
+    if database_type == "sqlite" and notes:
+        # Any ALTER beyond ADD/RENAME COLUMN copies every row into a new table
+        notes = [note for note in notes if not note.endswith("catalog-only")]
+        notes.append("SQLite recreates the table")
+        if impact == "low":
+            impact, lock = "medium", "exclusive while the table is copied"
+    elif database_type == "mysql" and any(note.endswith("catalog-only") for note in notes):
+        # InnoDB runs these in place but may still rebuild the table online
+        notes = [note.replace("catalog-only", "in place, possibly with a table rebuild")
+                 for note in notes]
+        if impact == "low":
+            impact, lock = "medium", "InnoDB online DDL (LOCK=NONE)"
+
+    return MigrationOperation(
+        action="alter_field",
+        model=model_name,
+        field=field_name,
+        field_config=new,
+        lock=lock,
+        impact=impact,
+        note="; ".join(notes) or "no schema change",
+    )
+
+
+def _index_operation(action: str, model_name: str, index: IndexSpec,
+                     database_type: str) -> MigrationOperation:
+    """Plan an index change using the least blocking method the database offers."""
+    verb = "built" if action == "add_index" else "dropped"
+    if database_type == "postgresql":
+        return MigrationOperation(
+            action=action, model=model_name, index=index, concurrent=True,
+            lock="share update exclusive (reads and writes continue)", impact="low",
+            note=f"{verb} CONCURRENTLY in a non-atomic migration",
+        )
+    if database_type == "mysql":
+        return MigrationOperation(
+            action=action, model=model_name, index=index,
+            lock="InnoDB online DDL (LOCK=NONE)", impact="low",
+            note=f"secondary index {verb} in place",
+        )
+    return MigrationOperation(
+        action=action, model=model_name, index=index,
+        lock=f"blocks writes while the index is {verb}", impact="medium",
+        note=f"{database_type} has no online index build",
+    )
+
+
+def plan_migration(config: APIConfig, previous: Optional[APIConfig] = None) -> List[MigrationOperation]:
+    """Plan the schema changes between two configuration versions.
+
+    Args:
+        config: New API configuration
+        previous: Configuration the database currently matches (None for a new database)
+
+    Returns:
+        Ordered schema operations with lock impact estimates
+    """
+    database_type = config.database.type
+    old_models = previous.models if previous else {}
+    operations = []
+
+    for model_name, model in config.models.items():
+        if model_name not in old_models:
+            note = "indexes are created with the empty table"
+            partition = model.partition_by
+            if partition and database_type == "postgresql":
+                size = {"month": "monthly ", "day": "daily "}[partition.interval] if partition.strategy == "range" else ""
+                note += f"; {size}{partition.strategy} partitions on {partition.key}"
+            elif partition:
+                note += f"; partition_by ignored: {database_type} has no declarative partitioning"
+            operations.append(MigrationOperation(
+                action="create_model", model=model_name, lock="new table", impact="none", note=note,
+            ))
+
+    for model_name in old_models:
+        if model_name not in config.models:
+            operations.append(MigrationOperation(
+                action="delete_model", model=model_name, lock="brief exclusive", impact="medium",
+                note="drops the table and its data",
+            ))
+
+    for model_name, model in config.models.items():
+        if model_name not in old_models:
+            continue
+        old_model = old_models[model_name]
+
+        # Indexes are dropped before their columns change and created afterwards
+        old_indexes = {index.name: index for index in model_indexes(previous, model_name)}
+        new_indexes = {index.name: index for index in model_indexes(config, model_name)}
+        for name, index in old_indexes.items():
+            if name not in new_indexes:
+                operations.append(_index_operation("remove_index", model_name, index, database_type))
+
+        for field_name, field in model.fields.items():
+            old_field = old_model.fields.get(field_name)
+            if old_field is None:
+                operations.extend(_add_field(model_name, field_name, field, database_type))
+            elif _schema_attributes(old_field) != _schema_attributes(field):
+                operations.append(_alter_field(model_name, field_name, old_field, field, database_type))
+        for field_name in _implicit_fields(model):
+            if field_name not in _implicit_fields(old_model) and field_name not in model.fields:
+                operations.extend(_add_field(model_name, field_name, None, database_type))
+
+        old_columns = set(old_model.fields) | set(_implicit_fields(old_model))
+        new_columns = set(model.fields) | set(_implicit_fields(model))
+        for field_name in sorted(old_columns - new_columns):
+            operations.append(MigrationOperation(
+                action="remove_field", model=model_name, field=field_name,
+                lock="brief exclusive (metadata only)", impact="low",
+                note="deploy code that no longer reads the column first",
+            ))
+
+        for name, index in new_indexes.items():
+            if name not in old_indexes:
+                operations.append(_index_operation("add_index", model_name, index, database_type))
+
+    return operations
+
+
+def format_migration_plan(operations: List[MigrationOperation], database_type: str) -> str:
+    """Render a migration plan as a Markdown report.
+
+    Args:
+        operations: Planned operations
+        database_type: Target database type
+
+    Returns:
+        Markdown table listing each operation and its lock impact
+    """
+    lines = [
+        f"# Migration Plan ({database_type})",
+        "",
+        "| Operation | Target | Impact | Lock | Notes |",
+        "|-----------|--------|--------|------|-------|",
+    ]
+    for op in operations:
+        target = op.model
+        if op.field:
+            target += f".{op.field}"
+        elif op.index:
+            target += f" ({', '.join(op.index.fields)})"
+        lines.append(f"| {op.action} | {target} | {op.impact} | {op.lock} | {op.note} |")
+    if not operations:
+        lines.append("| - | - | none | - | schema unchanged |")
+
+    blocking = [op for op in operations if op.impact == "high"]
+    lines.append("")
+    if blocking:
+        lines.append(f"**{len(blocking)} operation(s) can block traffic on large tables; schedule them.**")
+    else:
+        lines.append("No operation is expected to block reads or writes for long.")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,79 @@
+"""PostgreSQL declarative partitioning DDL for partitioned models."""
+
+from typing import List
+
+from adipose.schemas.config import PartitionConfig
+
+
+def partition_name(table: str, suffix: str) -> str:
+    """Name a partition after its parent table."""
+    return f"{table}_p{suffix}"
+
+
+def partition_table_sql(table: str, partition: PartitionConfig) -> List[str]:
+    """Turn a freshly created, empty table into a partitioned table.
+
+    The table is rebuilt from its own definition (columns, defaults, checks and
+    identity) with the partition key added to the primary key, as PostgreSQL
+    requires. Indexes and foreign keys must be created afterwards; they then
+    apply to every partition.
+
+    Args:
+        table: Table name
+        partition: Partitioning options
+
+    Returns:
+        SQL statements, in order
+    """
+    method = "RANGE" if partition.strategy == "range" else "HASH"
+    primary_key = ["id"] if partition.key == "id" else ["id", partition.key]
+    columns = ", ".join(f'"{column}"' for column in primary_key)
+    return [
+        f'ALTER TABLE "{table}" RENAME TO "{table}_unpartitioned"',
+        f'CREATE TABLE "{table}" (LIKE "{table}_unpartitioned" '
+        f'INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING IDENTITY) '
+        f'PARTITION BY {method} ("{partition.key}")',
+        f'DROP TABLE "{table}_unpartitioned"',
+        f'ALTER TABLE "{table}" ADD PRIMARY KEY ({columns})',
+    ]
+
+
+def initial_partitions_sql(table: str, partition: PartitionConfig) -> List[str]:
+    """Create the first partitions of a partitioned table.
+
+    Hash tables get all of their partitions. Range tables get the current
+    interval and `premake` future ones, computed when the SQL runs; later ones
+    are created by the backend's partition maintenance task.
+
+    Args:
+        table: Table name
+        partition: Partitioning options
+
+    Returns:
+        SQL statements, in order
+    """
+    if partition.strategy == "hash":
+        return [
+            f'CREATE TABLE "{partition_name(table, str(remainder))}" PARTITION OF "{table}" '
+            f'FOR VALUES WITH (MODULUS {partition.partitions}, REMAINDER {remainder})'
+            for remainder in range(partition.partitions)
+        ]
+
+    step = "months" if partition.interval == "month" else "days"
+    suffix_format = "YYYYMM" if partition.interval == "month" else "YYYYMMDD"
+    # Bounds are UTC midnights so partition names match the maintenance task
+    return [f"""DO $$
+DECLARE
+    first timestamptz := date_trunc('{partition.interval}', now() AT TIME ZONE 'UTC') AT TIME ZONE 'UTC';
+    lower timestamptz;
+BEGIN
+    FOR i IN 0..{partition.premake} LOOP
+        lower := first + make_interval({step} => i);
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+            '{table}_p' || to_char(lower AT TIME ZONE 'UTC', '{suffix_format}'), '{table}',
+            lower, lower + make_interval({step} => 1)
+        );
+    END LOOP;
+END
+$$"""]
@@ -0,0 +1,451 @@
+"""Synthetic seed data generation for Adipose models."""
+
+import csv
+import json
+import random
+import re
+import sqlite3
+import string
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+try:
+    from re import _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse
+
+from adipose.schemas.config import APIConfig, FieldConfig
+from adipose.utils.helpers import generate_example_value, model_dependency_order
+
+
+SEED_FORMATS = ("copy", "csv", "ndjson", "sqlite")
+
+# Timestamps fall in the year before this instant, so output does not depend on the clock
+EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+TIMESTAMP_WINDOW = 365 * 24 * 3600
+
+# Distinct values drawn per non-unique column; rows pick from this pool
+POOL_SIZE = 1024
+
+# Share of optional columns left NULL
+NULL_RATIO = 0.1
+
+WORDS = (
+    "alpha bravo charlie delta echo foxtrot golf hotel india juliet kilo lima mike "
+    "november oscar papa quebec romeo sierra tango uniform victor whiskey xray yankee zulu"
+).split()
+
+
+def _sample_pattern(pattern: str, rng: random.Random, max_repeat: int = 8) -> str:
+    """Generate a random string matching a regular expression."""
+    categories = {
+        sre_parse.CATEGORY_DIGIT: string.digits,
+        sre_parse.CATEGORY_WORD: string.ascii_letters + string.digits + "_",
+        sre_parse.CATEGORY_SPACE: " ",
+    }
+
+    def choices(items) -> str:
+        chars = []
+        for op, value in items:
+            if op == sre_parse.LITERAL:
+                chars.append(chr(value))
+            elif op == sre_parse.RANGE:
+                chars.extend(chr(c) for c in range(value[0], value[1] + 1))
+            elif op == sre_parse.CATEGORY:
+                chars.extend(categories.get(value, string.ascii_letters))
+        return "".join(chars) or string.ascii_letters
+
+    def walk(tokens) -> str:
+        out = []
+        for op, value in tokens:
+            if op == sre_parse.LITERAL:
+                out.append(chr(value))
+            elif op == sre_parse.NOT_LITERAL:
+                out.append(rng.choice([c for c in string.ascii_letters if ord(c) != value]))
+            elif op == sre_parse.ANY:
+                out.append(rng.choice(string.ascii_letters))
+            elif op == sre_parse.IN:
+                if value and value[0][0] == sre_parse.NEGATE:
+                    excluded = choices(value[1:])
+                    out.append(rng.choice([c for c in string.ascii_letters + string.digits if c not in excluded]))
+                else:
+                    out.append(rng.choice(choices(value)))
+            elif op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT):
+                low, high, item = value
+                high = min(high, low + max_repeat)
+                out.extend(walk(item) for _ in range(rng.randint(low, max(low, high))))
+            elif op == sre_parse.SUBPATTERN:
+                out.append(walk(value[-1]))
+            elif op == sre_parse.BRANCH:
+                out.append(walk(rng.choice(value[1])))
+        return "".join(out)
+
+    return walk(sre_parse.parse(pattern))
+
+
+def _fit_length(value: str, field: FieldConfig) -> str:
+    """Pad or trim a string to the field's length limits."""
+    if field.max_length:
+        value = value[:field.max_length]
+    if field.min_length and len(value) < field.min_length:
+        value = value.ljust(field.min_length, "x")
+    return value
+
+
+def _string_pool(field: FieldConfig, rng: random.Random) -> List[str]:
+    """Build distinct example strings that satisfy the field's constraints."""
+    if field.pattern:
+        if "@" in field.pattern and not re.fullmatch(field.pattern, _sample_pattern(field.pattern, rng)):
+            pool = [f"{rng.choice(WORDS)}.{rng.choice(WORDS)}@example.com" for _ in range(POOL_SIZE)]
+        else:
+            pool = [_sample_pattern(field.pattern, rng) for _ in range(POOL_SIZE)]
+        # Length limits are kept only where the result still matches the pattern
+        return [value for value in (_fit_length(v, field) for v in pool)
+                if re.fullmatch(field.pattern, value)] or pool
+    words = 30 if field.type.lower() == "text" else 2
+    return [
+        _fit_length(" ".join(rng.choice(WORDS) for _ in range(rng.randint(1, words))), field)
+        for _ in range(POOL_SIZE)
+    ]
+
+
+def _unique_string(value: str, sequence: int, field: FieldConfig) -> str:
+    """Make a string unique by embedding a row number, before any '@domain'."""
+    local, at, domain = value.partition("@")
+    suffix = str(sequence)
+    if field.max_length:
+        room = field.max_length - len(suffix) - len(at + domain)
+        if room < 0:
+            raise ValueError(f"max_length {field.max_length} is too short for {sequence} unique values")
+        local = local[:room]
+    return f"{local}{suffix}{at}{domain}"
+
+
+def _timestamp(seconds: float) -> str:
+    return (EPOCH - timedelta(seconds=seconds)).isoformat(sep=" ")
+
+
+def _timestamp_pool(rng: random.Random) -> List[str]:
+    """Random timestamps spread over the window, drawn per row instead of formatting each one."""
+    return [_timestamp(rng.randrange(TIMESTAMP_WINDOW)) for _ in range(POOL_SIZE * 8)]
+
+
+def _column_factory(field: FieldConfig, rng: random.Random,
+                    parent_rows: Optional[int]) -> Callable[[int], Any]:
+    """Build a function that returns the column value for a row number."""
+    field_type = field.type.lower()
+    # rng.random() with arithmetic is several times faster than randint()/choice()
+    rand = rng.random
+
+    if field.foreign_key:
+        if not parent_rows:
+            if field.required:
+                raise ValueError(f"{field.foreign_key} has no rows to reference; give it a row count")
+            return lambda row: None
+        return lambda row: 1 + int(rand() * parent_rows)
+
+    if field_type in ("integer", "float"):
+        low = field.min_value if field.min_value is not None else 0
+        high = field.max_value if field.max_value is not None else max(low, 0) + 10 ** 6
+        if field_type == "integer":
+            low, span = int(low), int(high) - int(low) + 1
+            if field.unique:
+                return lambda row: low + row
+            factory = lambda row: low + int(rand() * span)
+        else:
+            if field.unique:
+                return lambda row: float(low + row)
+            factory = lambda row: round(low + rand() * (high - low), 4)
+    elif field_type == "boolean":
+        factory = lambda row: rand() < 0.5
+    elif field_type in ("datetime", "date"):
+        if field.unique:
+            values = lambda row: _timestamp(row)
+        else:
+            pool = _timestamp_pool(rng)
+            size = len(pool)
+            values = lambda row: pool[int(rand() * size)]
+        factory = values if field_type == "datetime" else (lambda row: values(row)[:10])
+    elif field_type in ("string", "text"):
+        pool = _string_pool(field, rng)
+        size = len(pool)
+        if field.unique:
+            if field.pattern and not re.fullmatch(field.pattern, _unique_string(pool[0], 1, field)):
+                raise ValueError(f"cannot make unique values for pattern {field.pattern!r}")
+            return lambda row: _unique_string(pool[row % size], row, field)
+        factory = lambda row: pool[int(rand() * size)]
+    else:
+        example = generate_example_value(field_type)
+        if example is not None:
+            example = json.dumps(example)
+        factory = lambda row: example
+
+    if field.required or field.unique:
+        return factory
+    return lambda row: None if rand() < NULL_RATIO else factory(row)
+
+
+def _declared_columns(model) -> List[str]:
+    """Declared fields other than the id and the timestamps the model manages itself."""
+    managed = ("id", "created_at", "updated_at") if model.timestamps else ("id",)
+    return [name for name in model.fields if name not in managed]
+
+
+def seed_columns(config: APIConfig, model_name: str) -> List[str]:
+    """Get the columns seeded for a model, in output order."""
+    model = config.models[model_name]
+    columns = ["id"] + _declared_columns(model)
+    if model.timestamps:
+        columns += ["created_at", "updated_at"]
+    if model.soft_delete:
+        columns.append("deleted_at")
+    return columns
+
+
+def generate_rows(config: APIConfig, model_name: str, count: int, row_counts: Dict[str, int],
+                  seed: int = 0) -> Iterator[List[Any]]:
+    """Stream rows for a model with sequential ids starting at 1.
+
+    Args:
+        config: API configuration
+        model_name: Model to generate
+        count: Number of rows
+        row_counts: Rows generated per model, used to pick foreign keys
+        seed: Seed; the same seed always yields the same rows
+
+    Yields:
+        Row values in seed_columns() order
+    """
+    model = config.models[model_name]
+    rng = random.Random(f"{seed}:{model_name}")
+    factories = [
+        _column_factory(field, rng, row_counts.get(field.foreign_key) if field.foreign_key else None)
+        for field in (model.fields[name] for name in _declared_columns(model))
+    ]
+    timestamps = _timestamp_pool(rng) if model.timestamps else None
+    rand = rng.random
+    soft_delete = model.soft_delete
+
+    for row in range(1, count + 1):
+        values = [row]
+        values += [factory(row) for factory in factories]
+        if timestamps:
+            created = timestamps[int(rand() * len(timestamps))]
+            values += [created, created]
+        if soft_delete:
+            values.append(None)
+        yield values
+
+
+class SeedWriter:
+    """Base class for bulk-load output formats."""
+
+    def __init__(self, output: Path):
+        self.output = output
+
+    def write_table(self, table: str, columns: List[str], rows: Iterator[List[Any]],
+                    batch_size: int) -> int:
+        """Write every row of one table and return the row count."""
+        raise NotImplementedError
+
+    def finish(self, tables: List[Dict[str, Any]]):
+        """Write any load script once all tables are done."""
+
+
+class CopyWriter(SeedWriter):
+    """PostgreSQL COPY text format, loaded with the generated load.sql."""
+
+    ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+    def _format(self, value: Any) -> str:
+        if value is None:
+            return "\\N"
+        if value is True:
+            return "t"
+        if value is False:
+            return "f"
+        if isinstance(value, str):
+            return value.translate(self.ESCAPES)
+        return str(value)
+
+    def write_table(self, table, columns, rows, batch_size):
+        count = 0
+        fmt = self._format
+        with open(self.output / f"{table}.copy", "w", encoding="utf-8", newline="") as f:
+            batch = []
+            for row in rows:
+                # Plain strings and ints skip the Python-level formatter, which dominates the cost
+                batch.append("\t".join([
+                    value if value.__class__ is str and value.isprintable() and "\\" not in value
+                    else str(value) if value.__class__ is int
+                    else fmt(value)
+                    for value in row
+                ]))
+                if len(batch) >= batch_size:
+                    f.write("\n".join(batch) + "\n")
+                    count += len(batch)
+                    batch = []
+            if batch:
+                f.write("\n".join(batch) + "\n")
+                count += len(batch)
+        return count
+
+    def finish(self, tables):
+        lines = ["-- Load with: psql -f load.sql (from this directory)", "BEGIN;"]
+        for table in tables:
+            column_list = ", ".join(f'"{column}"' for column in table["columns"])
+            lines.append(f"\\copy \"{table['table']}\" ({column_list}) FROM '{table['table']}.copy'")
+        for table in tables:
+            lines.append(
+                f"SELECT setval(pg_get_serial_sequence('\"{table['table']}\"', 'id'), "
+                f"(SELECT COALESCE(MAX(id), 1) FROM \"{table['table']}\"));"
+            )
+        lines += ["COMMIT;", "ANALYZE;", ""]
+        (self.output / "load.sql").write_text("\n".join(lines), encoding="utf-8")
+
+
+class CsvWriter(SeedWriter):
+    """CSV with a header row; booleans as 1/0 and NULL as an empty field."""
+
+    def write_table(self, table, columns, rows, batch_size):
+        count = 0
+        with open(self.output / f"{table}.csv", "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(columns)
+            batch = []
+            for row in rows:
+                batch.append([int(value) if isinstance(value, bool) else value for value in row])
+                if len(batch) >= batch_size:
+                    writer.writerows(batch)
+                    count += len(batch)
+                    batch = []
+            writer.writerows(batch)
+            count += len(batch)
+        return count
+
+
+class NdjsonWriter(SeedWriter):
+    """One JSON object per line."""
+
+    def write_table(self, table, columns, rows, batch_size):
+        count = 0
+        encode = json.JSONEncoder(separators=(",", ":")).encode
+        with open(self.output / f"{table}.ndjson", "w", encoding="utf-8") as f:
+            batch = []
+            for row in rows:
+                batch.append(encode(dict(zip(columns, row))))
+                if len(batch) >= batch_size:
+                    f.write("\n".join(batch) + "\n")
+                    count += len(batch)
+                    batch = []
+            if batch:
+                f.write("\n".join(batch) + "\n")
+                count += len(batch)
+        return count
+
+
+class SqliteWriter(SeedWriter):
+    """Batched inserts into an existing SQLite database whose tables are already migrated."""
+
+    def __init__(self, output: Path):
+        super().__init__(output)
+        self.connection = sqlite3.connect(str(output), isolation_level=None)
+        # Seeding is restartable, so trade durability for load speed
+        self.connection.execute("PRAGMA journal_mode = OFF")
+        self.connection.execute("PRAGMA synchronous = OFF")
+
+    def write_table(self, table, columns, rows, batch_size):
+        count = 0
+        column_list = ", ".join(f'"{column}"' for column in columns)
+        placeholders = ", ".join("?" for _ in columns)
+        sql = f'INSERT INTO "{table}" ({column_list}) VALUES ({placeholders})'
+        self.connection.execute("BEGIN")
+        # Building secondary indexes once after the load is much cheaper than maintaining them per row
+        indexes = self.connection.execute(
+            "SELECT name, sql FROM sqlite_master WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL",
+            (table,),
+        ).fetchall()
+        for name, _ in indexes:
+            self.connection.execute(f'DROP INDEX "{name}"')
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= batch_size:
+                self.connection.executemany(sql, batch)
+                count += len(batch)
+                batch = []
+        self.connection.executemany(sql, batch)
+        count += len(batch)
+        for _, index_sql in indexes:
+            self.connection.execute(index_sql)
+        self.connection.execute("COMMIT")
+        return count
+
+    def finish(self, tables):
+        self.connection.execute("ANALYZE")
+        self.connection.close()
+
+
+WRITERS = {
+    "copy": CopyWriter,
+    "csv": CsvWriter,
+    "ndjson": NdjsonWriter,
+    "sqlite": SqliteWriter,
+}
+
+
+def write_seed_data(
+    config: APIConfig,
+    output: str,
+    row_counts: Dict[str, int],
+    fmt: str = "copy",
+    seed: int = 0,
+    table_prefix: str = "",
+    batch_size: int = 10000,
+    on_table: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> List[Dict[str, Any]]:
+    """Generate seed data for every model in foreign-key order.
+
+    Rows are streamed in batches, so memory use does not grow with row counts.
+
+    Args:
+        config: API configuration
+        output: Output directory, or the SQLite database file for the sqlite format
+        row_counts: Rows to generate per model
+        fmt: One of SEED_FORMATS
+        seed: Seed for reproducible output
+        table_prefix: Prefix for tables without a custom table_name (e.g. 'api_' for Django)
+        batch_size: Rows buffered per write
+        on_table: Called with each table's statistics when it is done
+
+    Returns:
+        Per-table statistics (table, columns, rows, seconds)
+    """
+    if fmt not in WRITERS:
+        raise ValueError(f"Unknown seed format '{fmt}', expected one of {', '.join(SEED_FORMATS)}")
+    output_path = Path(output)
+    if fmt != "sqlite":
+        output_path.mkdir(parents=True, exist_ok=True)
+    writer = WRITERS[fmt](output_path)
+
+    tables = []
+    for model_name in model_dependency_order(config.models):
+        model = config.models[model_name]
+        table = model.table_name or f"{table_prefix}{model_name.lower()}"
+        columns = seed_columns(config, model_name)
+        started = time.perf_counter()
+        count = writer.write_table(
+            table, columns,
+            generate_rows(config, model_name, row_counts.get(model_name, 0), row_counts, seed),
+            batch_size,
+        )
+        stats = {"table": table, "columns": columns, "rows": count,
+                 "seconds": time.perf_counter() - started}
+        tables.append(stats)
+        if on_table:
+            on_table(stats)
+
+    writer.finish(tables)
+    return tables
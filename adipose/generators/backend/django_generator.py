@@ -1,6 +1,16 @@
 """Django backend generator."""
 
+import re
+
 from adipose.core.generator import CodeGenerator
+from adipose.core.indexes import model_indexes, format_index_report
+from adipose.core.migrations import plan_migration, format_migration_plan
+from adipose.core.partitions import partition_table_sql, initial_partitions_sql
+from adipose.utils.helpers import generate_field_example, model_dependency_order
+
+
+# Field types the Django model template maps to a model field
+DJANGO_FIELD_TYPES = ('integer', 'string', 'text', 'boolean', 'datetime', 'float')
 
 
 class DjangoGenerator(CodeGenerator):
@@ -13,16 +23,36 @@ class DjangoGenerator(CodeGenerator):
         # Generate project structure
         self._generate_settings()
         self._generate_urls()
+        if self.config.django.asgi:
+            self._generate_asgi()
         self._generate_models()
+        self._generate_migrations()
         self._generate_serializers()
         self._generate_views()
         self._generate_authentication()
         self._generate_middleware()
+        self._generate_management_commands()
+        if self.config.testing.query_count_tests:
+            self._generate_tests()
         self._generate_requirements()
         self._generate_manage_py()
         
         print("\n=== Django Backend Generation Complete ===\n")
     
+    def get_context(self):
+        """Get template context, adding the read replicas to route to."""
+        context = super().get_context()
+        database = self.config.database
+        # SQLite databases are local files and have no replicas
+        context['replicas'] = database.replicas if database and database.type != 'sqlite' else []
+        # Declarative partitioning is PostgreSQL-only; other databases get plain tables
+        context['partitioned'] = {
+            model_name: model_config.table_name or f'api_{model_name.lower()}'
+            for model_name, model_config in self.config.models.items()
+            if model_config.partition_by and database and database.type == 'postgresql'
+        }
+        return context
+    
     def _generate_settings(self):
         """Generate Django settings file."""
         context = self.get_context()
@@ -35,14 +65,27 @@ class DjangoGenerator(CodeGenerator):
         content = self.render_template('backend/django/urls.py.j2', context)
         self.write_file(f'{self.config.project.name}/urls.py', content)
     
+    def _generate_asgi(self):
+        """Generate ASGI entry point."""
+        context = self.get_context()
+        content = self.render_template('backend/django/asgi.py.j2', context)
+        self.write_file(f'{self.config.project.name}/asgi.py', content)
+    
     def _generate_models(self):
         """Generate Django models."""
         context = self.get_context()
         for model_name, model_config in self.config.models.items():
-            ctx = {**context, 'model_name': model_name, 'model': model_config}
+            ctx = {
+                **context,
+                'model_name': model_name,
+                'model': model_config,
+                'indexes': model_indexes(self.config, model_name),
+            }
             content = self.render_template('backend/django/model.py.j2', ctx)
             self.write_file(f'api/models/{model_name.lower()}.py', content)
         
+        self.write_file('index_report.md', format_index_report(self.config))
+        
         # Generate __init__.py for models
         model_imports = '\n'.join([
             f"from .{name.lower()} import {name}" 
@@ -50,6 +93,74 @@ class DjangoGenerator(CodeGenerator):
         ])
         self.write_file('api/models/__init__.py', model_imports)
     
+    def _generate_migrations(self):
+        """Generate migrations from the config, or from its diff with the previous config."""
+        if not self.config.database.migrations:
+            return
+        
+        operations = plan_migration(self.config, self.previous_config)
+        self.write_file('migration_plan.md', format_migration_plan(operations, self.config.database.type))
+        self.write_file('api/migrations/__init__.py', '')
+        if not operations:
+            return
+        
+        if self.previous_config is None:
+            number, name, dependencies = 1, 'initial', []
+        else:
+            latest = self._latest_migration()
+            number = int(latest[:4]) + 1 if latest else 2
+            name = re.sub(r'\W', '_', f'v{self.config.project.version}')
+            dependencies = [latest or '0001_initial']
+        
+        context = self.get_context()
+        indexes = {model_name: model_indexes(self.config, model_name) for model_name in self.config.models}
+        partition_sql = {
+            model_name: ';\n'.join(
+                partition_table_sql(table, self.config.models[model_name].partition_by)
+                + initial_partitions_sql(table, self.config.models[model_name].partition_by)
+            ) + ';'
+            for model_name, table in context['partitioned'].items()
+        }
+        # Concurrent index changes run in their own non-atomic migrations, with
+        # drops before and builds after the schema changes
+        batches = [
+            ([op for op in operations if op.concurrent and op.action == 'remove_index'],
+             f'{name}_drop_indexes', 'concurrent index removal', True),
+            ([op for op in operations if not op.concurrent], name, 'schema changes', False),
+            ([op for op in operations if op.concurrent and op.action == 'add_index'],
+             f'{name}_indexes', 'concurrent index creation', True),
+        ]
+        for batch, batch_name, summary, concurrent in batches:
+            if not batch:
+                continue
+            migration_name = f'{number:04d}_{batch_name}'
+            ctx = {
+                **context,
+                'description': f'{self.config.project.name} {self.config.project.version}: {summary}.',
+                'operations': batch,
+                'indexes': indexes,
+                'partition_sql': partition_sql,
+                'dependencies': dependencies,
+                'initial': number == 1,
+                'concurrent': concurrent,
+                'uses_timezone': any(op.one_off_default == 'timezone.now' for op in batch) or any(
+                    field.default == 'now'
+                    for op in batch if op.action == 'create_model'
+                    for field in self.config.models[op.model].fields.values()
+                ),
+            }
+            content = self.render_template('backend/django/migration.py.j2', ctx)
+            self.write_file(f'api/migrations/{migration_name}.py', content)
+            number, dependencies = number + 1, [migration_name]
+    
+    def _latest_migration(self):
+        """Find the newest migration already present in the output directory."""
+        migrations_dir = self.output_dir / 'api' / 'migrations'
+        if not migrations_dir.exists():
+            return None
+        names = [path.stem for path in migrations_dir.glob('*.py') if re.match(r'^\d{4}_\w+$', path.stem)]
+        return max(names) if names else None
+    
     def _generate_serializers(self):
         """Generate DRF serializers."""
         context = self.get_context()
@@ -61,10 +172,23 @@ class DjangoGenerator(CodeGenerator):
     def _generate_views(self):
         """Generate Django views."""
         context = self.get_context()
+        template = 'viewset_async.py.j2' if self.config.django.asgi else 'viewset.py.j2'
         for endpoint in self.config.endpoints:
             ctx = {**context, 'endpoint': endpoint}
-            content = self.render_template('backend/django/viewset.py.j2', ctx)
+            content = self.render_template(f'backend/django/{template}', ctx)
             self.write_file(f'api/views/{endpoint.resource}.py', content)
+        
+        if any('export' in endpoint.operations for endpoint in self.config.endpoints):
+            content = self.render_template('backend/django/export.py.j2', context)
+            self.write_file('api/export.py', content)
+        
+        if any('changes' in endpoint.operations for endpoint in self.config.endpoints):
+            content = self.render_template('backend/django/sync.py.j2', context)
+            self.write_file('api/sync.py', content)
+        
+        if self.config.performance.binary_formats:
+            content = self.render_template('backend/django/renderers.py.j2', context)
+            self.write_file('api/renderers.py', content)
     
     def _generate_authentication(self):
         """Generate authentication middleware."""
@@ -77,6 +201,107 @@ class DjangoGenerator(CodeGenerator):
         context = self.get_context()
         content = self.render_template('backend/django/middleware.py.j2', context)
         self.write_file('api/middleware.py', content)
+        
+        if self.config.metrics.enabled:
+            content = self.render_template('backend/django/metrics.py.j2', context)
+            self.write_file('api/metrics.py', content)
+        
+        if context['replicas']:
+            content = self.render_template('backend/django/db_router.py.j2', context)
+            self.write_file('api/db_router.py', content)
+    
+    def _generate_management_commands(self):
+        """Generate management commands."""
+        context = self.get_context()
+        soft_delete_models = [
+            name for name, model_config in self.config.models.items() if model_config.soft_delete
+        ]
+        range_tables = {
+            table: self.config.models[model_name].partition_by
+            for model_name, table in context['partitioned'].items()
+            if self.config.models[model_name].partition_by.strategy == 'range'
+        }
+        if not soft_delete_models and not range_tables:
+            return
+        
+        self.write_file('api/management/__init__.py', '')
+        self.write_file('api/management/commands/__init__.py', '')
+        
+        if soft_delete_models:
+            ctx = {**context, 'soft_delete_models': soft_delete_models}
+            content = self.render_template('backend/django/purge_deleted.py.j2', ctx)
+            self.write_file('api/management/commands/purge_deleted.py', content)
+        
+        if range_tables:
+            ctx = {**context, 'tables': range_tables}
+            content = self.render_template('backend/django/manage_partitions.py.j2', ctx)
+            self.write_file('api/management/commands/manage_partitions.py', content)
+    
+    def _generate_tests(self):
+        """Generate query-count regression tests for every endpoint."""
+        context = self.get_context()
+        fixtures = {}
+        for model_name, model_config in self.config.models.items():
+            implicit = ('created_at', 'updated_at') if model_config.timestamps else ()
+            fields = {
+                field_name: field for field_name, field in model_config.fields.items()
+                if field_name != 'id' and field_name not in implicit
+                and (field.foreign_key or field.type.lower() in DJANGO_FIELD_TYPES)
+            }
+            fixtures[model_name] = {
+                'values': {
+                    field_name: generate_field_example(field)
+                    for field_name, field in fields.items() if not field.foreign_key
+                },
+                'unique': {
+                    field_name: field.max_length
+                    for field_name, field in fields.items() if field.unique and not field.foreign_key
+                },
+                'foreign_keys': {
+                    field_name: field.foreign_key
+                    for field_name, field in fields.items() if field.foreign_key
+                },
+                # Foreign keys rendered as ForeignKey take the referenced id as <field>_id
+                'relations': [
+                    field_name for field_name, field in fields.items()
+                    if field.foreign_key and field.type.lower() not in DJANGO_FIELD_TYPES
+                ],
+            }
+        
+        ctx = {
+            **context,
+            'fixtures': fixtures,
+            'order': model_dependency_order(self.config.models),
+            'budgets': {endpoint.resource: self._query_budgets(endpoint) for endpoint in self.config.endpoints},
+            'testing': self.config.testing,
+        }
+        content = self.render_template('backend/django/test_query_counts.py.j2', ctx)
+        self.write_file('api/tests/test_query_counts.py', content)
+        self.write_file('api/tests/__init__.py', '')
+        # Test discovery needs api to be a regular package
+        self.write_file('api/__init__.py', '')
+    
+    def _query_budgets(self, endpoint):
+        """Expected queries per operation for the generated views."""
+        model = self.config.models[endpoint.model]
+        # ModelSerializer adds a UniqueValidator, one query each, for every unique field
+        unique_checks = sum(
+            1 for field_name, field in model.fields.items()
+            if field.unique and field_name != 'id' and field.type.lower() in DJANGO_FIELD_TYPES
+        )
+        # Paginated lists run COUNT plus SELECT; the sync viewset paginates through DRF even without it
+        paginated = endpoint.pagination or not self.config.django.asgi
+        counted = paginated and not (endpoint.pagination and endpoint.pagination_mode == 'slice')
+        return {
+            'list': 2 if counted else 1,
+            'read': 1,
+            'create': 1 + unique_checks,
+            'update': 2 + unique_checks,
+            'delete': 2,
+            'search': 1,
+            'export': 1,
+            'changes': 1,
+        }
     
     def _generate_requirements(self):
         """Generate requirements.txt."""
@@ -88,11 +313,28 @@ class DjangoGenerator(CodeGenerator):
             'python-dotenv>=1.0.0',
         ]
         
-        if self.config.database.type == 'postgresql':
+        if self.config.django.asgi:
+            requirements.append('adrf>=0.1.6')
+            requirements.append('uvicorn[standard]>=0.23.0')
+        
+        performance = self.config.performance
+        if self.config.database.type == 'postgresql' and performance.connection_pool:
+            requirements[0] = 'Django>=5.1.0'
+            requirements.append('psycopg[binary,pool]>=3.1.0')
+        elif self.config.database.type == 'postgresql':
             requirements.append('psycopg2-binary>=2.9.0')
         elif self.config.database.type == 'mysql':
             requirements.append('mysqlclient>=2.2.0')
         
+        if performance.compression and performance.brotli:
+            requirements.append('Brotli>=1.1.0')
+        if performance.fast_json:
+            requirements.append('drf-orjson-renderer>=1.7.0')
+        if 'msgpack' in performance.binary_formats:
+            requirements.append('msgpack>=1.0.0')
+        if 'cbor' in performance.binary_formats:
+            requirements.append('cbor2>=5.4.0')
+        
         self.write_file('requirements.txt', '\n'.join(requirements))
     
     def _generate_manage_py(self):
@@ -1,6 +1,8 @@
 """ASP.NET Core backend generator."""
 
 from adipose.core.generator import CodeGenerator
+from adipose.core.indexes import model_indexes, format_index_report
+from adipose.utils.helpers import resource_class_name, to_pascal_case, type_mapping
 
 
 class DotNetGenerator(CodeGenerator):
@@ -14,14 +16,37 @@ class DotNetGenerator(CodeGenerator):
         self._generate_program()
         self._generate_models()
         self._generate_dtos()
-        self._generate_controllers()
+        if self.dotnet.minimal_api:
+            self._generate_endpoints()
+        else:
+            self._generate_controllers()
         self._generate_services()
         self._generate_dbcontext()
+        if self.dotnet.compiled_queries:
+            self._generate_compiled_queries()
+        if self.dotnet.source_generated_json:
+            self._generate_json_context()
+        if self.dotnet.db_context_pool_size or self.dotnet.source_generated_json:
+            self._generate_performance_extensions()
+        if self.dotnet.aot:
+            self._generate_aot_props()
         self._generate_middleware()
         self._generate_appsettings()
         
         print("\n=== .NET Backend Generation Complete ===\n")
     
+    @property
+    def dotnet(self):
+        """.NET options with the settings other options depend on filled in."""
+        options = self.config.dotnet
+        return options.model_copy(update={
+            # Minimal-API handlers read through the compiled queries
+            'compiled_queries': options.compiled_queries or options.minimal_api,
+            # Trimming may remove what the reflection-based serializer needs
+            'source_generated_json': options.source_generated_json or options.aot,
+            'db_context_pool_size': 0 if self.config.database.type == 'mongodb' else options.db_context_pool_size,
+        })
+    
     def _generate_csproj(self):
         """Generate .csproj file."""
         context = self.get_context()
@@ -69,8 +94,104 @@ class DotNetGenerator(CodeGenerator):
     def _generate_dbcontext(self):
         """Generate DbContext."""
         context = self.get_context()
-        content = self.render_template('backend/dotnet/DbContext.cs.j2', context)
+        indexes = {model_name: model_indexes(self.config, model_name) for model_name in self.config.models}
+        content = self.render_template('backend/dotnet/DbContext.cs.j2', {**context, 'indexes': indexes})
         self.write_file('Data/ApplicationDbContext.cs', content)
+        self.write_file('index_report.md', format_index_report(self.config))
+    
+    def _id_type(self, model_name):
+        """Get the C# type of a model's primary key."""
+        id_field = self.config.models[model_name].fields.get('id')
+        return type_mapping(id_field.type, 'csharp') if id_field else 'int'
+    
+    def _generate_list_page(self):
+        """Generate the list response shared by compiled queries and the JSON context."""
+        content = self.render_template('backend/dotnet/ListPage.cs.j2', self.get_context())
+        self.write_file('DTOs/ListPage.cs', content)
+    
+    def _query_context(self, endpoint):
+        """Describe an endpoint's filters and sorts as C# parameters and properties."""
+        model = self.config.models[endpoint.model]
+        columns = {name: field for name, field in model.fields.items() if name != 'id'}
+        filters = []
+        for name in endpoint.filters or []:
+            field = columns.get(name)
+            if field is None:
+                continue
+            base = self._id_type(field.foreign_key) if field.foreign_key else type_mapping(field.type, 'csharp')
+            param = to_pascal_case(name)
+            param = param[0].lower() + param[1:]
+            filters.append({
+                'name': name,
+                'property': to_pascal_case(name),
+                'param': param,
+                'type': f'{base}?',
+                'declaration': f'{base}? {param}',
+            })
+        sortable = set(columns) | ({'created_at', 'updated_at'} if model.timestamps else set()) | {'id'}
+        sorts = [
+            {'name': name, 'property': to_pascal_case(name)}
+            for name in endpoint.sort_fields or [] if name in sortable
+        ]
+        return {
+            'endpoint': endpoint,
+            # Endpoints on the same model get their own classes, named after the resource
+            'class_name': resource_class_name(endpoint.resource),
+            'model': model,
+            'id_type': self._id_type(endpoint.model),
+            'filters': filters,
+            'sorts': sorts,
+            'writable': [
+                to_pascal_case(name) for name in columns
+                if not (model.timestamps and name in ('created_at', 'updated_at'))
+            ],
+        }
+    
+    def _generate_compiled_queries(self):
+        """Generate no-tracking compiled queries for each endpoint's read and list shapes."""
+        context = self.get_context()
+        self._generate_list_page()
+        for endpoint in self.config.endpoints:
+            ctx = {**context, **self._query_context(endpoint)}
+            content = self.render_template('backend/dotnet/Queries.cs.j2', ctx)
+            self.write_file(f'Data/Queries/{ctx["class_name"]}Queries.cs', content)
+    
+    def _generate_endpoints(self):
+        """Generate minimal-API endpoint groups and their service registration."""
+        context = self.get_context()
+        for endpoint in self.config.endpoints:
+            ctx = {**context, **self._query_context(endpoint)}
+            timestamps = ['CreatedAt', 'UpdatedAt'] if ctx['model'].timestamps else []
+            ctx['dto_properties'] = ['Id'] + ctx['writable'] + timestamps
+            content = self.render_template('backend/dotnet/Endpoints.cs.j2', ctx)
+            self.write_file(f'Endpoints/{ctx["class_name"]}Endpoints.cs', content)
+        
+        content = self.render_template('backend/dotnet/ValidationFilter.cs.j2', context)
+        self.write_file('Endpoints/ValidationFilter.cs', content)
+        
+        classes = {endpoint.resource: resource_class_name(endpoint.resource) for endpoint in self.config.endpoints}
+        content = self.render_template('backend/dotnet/MinimalApiExtensions.cs.j2', {**context, 'classes': classes})
+        self.write_file('Extensions/MinimalApiExtensions.cs', content)
+    
+    def _generate_json_context(self):
+        """Generate the System.Text.Json source-generated serializer context."""
+        if not self.dotnet.compiled_queries:
+            self._generate_list_page()
+        content = self.render_template('backend/dotnet/JsonContext.cs.j2', self.get_context())
+        self.write_file('Serialization/AppJsonSerializerContext.cs', content)
+    
+    def _generate_performance_extensions(self):
+        """Generate the service registration for DbContext pooling and source-generated JSON."""
+        if self.config.dotnet.db_context_pool_size and self.config.database.type == 'mongodb':
+            print("  Skipping DbContext pooling: no pooled EF Core provider is generated for mongodb")
+        context = {**self.get_context(), 'dotnet': self.dotnet}
+        content = self.render_template('backend/dotnet/PerformanceExtensions.cs.j2', context)
+        self.write_file('Extensions/PerformanceExtensions.cs', content)
+    
+    def _generate_aot_props(self):
+        """Generate Directory.Build.props enabling ReadyToRun, partially trimmed publishing."""
+        content = self.render_template('backend/dotnet/Directory.Build.props.j2', self.get_context())
+        self.write_file('Directory.Build.props', content)
     
     def _generate_middleware(self):
         """Generate middleware."""
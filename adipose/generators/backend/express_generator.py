@@ -1,6 +1,21 @@
 """Express.js backend generator."""
 
 from adipose.core.generator import CodeGenerator
+from adipose.core.indexes import get_columns
+from adipose.utils.helpers import generate_field_example, pluralize, to_snake_case
+
+
+# Field types checked by the compiled validators, by the JS value kind they expect
+JS_VALUE_KINDS = {
+    'string': 'string',
+    'text': 'string',
+    'integer': 'integer',
+    'float': 'number',
+    'boolean': 'boolean',
+    'datetime': 'datetime',
+    'date': 'datetime',
+    'array': 'array',
+}
 
 
 class ExpressGenerator(CodeGenerator):
@@ -12,10 +27,16 @@ class ExpressGenerator(CodeGenerator):
         
         self._generate_package_json()
         self._generate_server()
+        if self.config.express.cluster:
+            self._generate_cluster()
         self._generate_models()
         self._generate_routes()
         self._generate_controllers()
         self._generate_middleware()
+        if self.config.express.compiled_schemas:
+            self._generate_schemas()
+        if self.config.express.data_layer:
+            self._generate_data_layer()
         self._generate_utils()
         self._generate_env_example()
         
@@ -33,11 +54,21 @@ class ExpressGenerator(CodeGenerator):
         content = self.render_template('backend/express/server.js.j2', context)
         self.write_file('src/server.js', content)
     
+    def _generate_cluster(self):
+        """Generate the clustered entry point that runs server.js in one worker per core."""
+        context = self.get_context()
+        content = self.render_template('backend/express/cluster.js.j2', {**context, 'express': self.config.express})
+        self.write_file('src/cluster.js', content)
+    
+    def _table_name(self, model_name):
+        """Get a model's table: its table_name, or the snake_case plural of its name."""
+        return self.config.models[model_name].table_name or pluralize(to_snake_case(model_name))
+    
     def _generate_models(self):
         """Generate data models."""
         context = self.get_context()
         for model_name, model_config in self.config.models.items():
-            ctx = {**context, 'model_name': model_name, 'model': model_config}
+            ctx = {**context, 'model_name': model_name, 'model': model_config, 'table': self._table_name(model_name)}
             content = self.render_template('backend/express/model.js.j2', ctx)
             self.write_file(f'src/models/{model_name}.js', content)
     
@@ -77,6 +108,79 @@ class ExpressGenerator(CodeGenerator):
         content = self.render_template('backend/express/validation_middleware.js.j2', context)
         self.write_file('src/middleware/validation.js', content)
     
+    def _generate_schemas(self):
+        """Generate compiled per-model validators and serializers, and their benchmark."""
+        context = self.get_context()
+        for model_name, model_config in self.config.models.items():
+            ctx = {**context, 'model_name': model_name, 'model': model_config, 'kinds': JS_VALUE_KINDS}
+            content = self.render_template('backend/express/schema.js.j2', ctx)
+            self.write_file(f'src/schemas/{model_name}.js', content)
+        
+        content = self.render_template('backend/express/schemas_index.js.j2', context)
+        self.write_file('src/schemas/index.js', content)
+        
+        # Benchmark the model with the most fields, the one runtime interpretation costs most
+        model_name = max(self.config.models, key=lambda name: len(self.config.models[name].fields))
+        model = self.config.models[model_name]
+        implicit = ('id', 'created_at', 'updated_at') if model.timestamps else ('id',)
+        writable = {name: field for name, field in model.fields.items() if name not in implicit}
+        rules = {
+            name: {
+                'kind': JS_VALUE_KINDS.get(field.type.lower()),
+                'required': field.required and field.default is None,
+                'nullable': field.nullable,
+                'min_length': field.min_length,
+                'max_length': field.max_length,
+                'min_value': field.min_value,
+                'max_value': field.max_value,
+                'pattern': field.pattern.replace('(?P<', '(?<') if field.pattern else None,
+            }
+            for name, field in writable.items()
+        }
+        datetime_fields = [name for name, rule in rules.items() if rule['kind'] == 'datetime']
+        if model.timestamps:
+            datetime_fields += ['created_at', 'updated_at']
+        ctx = {
+            **context,
+            'model_name': model_name,
+            'rules': rules,
+            'body': {name: generate_field_example(field) for name, field in writable.items()},
+            'datetime_fields': datetime_fields,
+            'page_size': 20,
+        }
+        content = self.render_template('backend/express/bench_schemas.js.j2', ctx)
+        self.write_file('bench/schemas.js', content)
+    
+    def _generate_data_layer(self):
+        """Generate the connection pool and a prepared-statement repository per endpoint."""
+        if self.config.database.type != 'postgresql':
+            print(f"  Skipping data layer: named prepared statements need PostgreSQL, not {self.config.database.type}")
+            return
+        
+        context = self.get_context()
+        content = self.render_template('backend/express/pool.js.j2', context)
+        self.write_file('src/data/pool.js', content)
+        
+        for endpoint in self.config.endpoints:
+            model = self.config.models[endpoint.model]
+            columns = get_columns(self.config, endpoint.model)
+            implicit = ('id', 'created_at', 'updated_at', 'deleted_at') if model.timestamps else ('id', 'deleted_at')
+            writable = [name for name in columns if name not in implicit]
+            ctx = {
+                **context,
+                'endpoint': endpoint,
+                'model_name': endpoint.model,
+                'model': model,
+                'table': self._table_name(endpoint.model),
+                'columns': columns,
+                'writable': writable,
+                'defaults': {name: model.fields[name].default for name in writable},
+                'filters': [name for name in endpoint.filters or [] if name in columns],
+                'sorts': [name for name in endpoint.sort_fields or [] if name in columns],
+            }
+            content = self.render_template('backend/express/repository.js.j2', ctx)
+            self.write_file(f'src/data/{endpoint.resource}.js', content)
+    
     def _generate_utils(self):
         """Generate utility files."""
         context = self.get_context()
@@ -1,6 +1,8 @@
 """Laravel backend generator."""
 
 from adipose.core.generator import CodeGenerator
+from adipose.core.indexes import model_indexes, format_index_report
+from adipose.utils.helpers import relation_name, resource_class_name
 
 
 class LaravelGenerator(CodeGenerator):
@@ -13,12 +15,15 @@ class LaravelGenerator(CodeGenerator):
         self._generate_composer_json()
         self._generate_models()
         self._generate_controllers()
+        self._generate_queries()
         self._generate_requests()
         self._generate_resources()
         self._generate_routes()
         self._generate_middleware()
         self._generate_migrations()
         self._generate_env_example()
+        if self.config.laravel.octane:
+            self._generate_octane()
         
         print("\n=== Laravel Backend Generation Complete ===\n")
     
@@ -44,6 +49,30 @@ class LaravelGenerator(CodeGenerator):
             content = self.render_template('backend/laravel/Controller.php.j2', ctx)
             self.write_file(f'app/Http/Controllers/{endpoint.model}Controller.php', content)
     
+    def _generate_queries(self):
+        """Generate per-endpoint query classes with eager loading, pagination and chunked reads."""
+        context = self.get_context()
+        for endpoint in self.config.endpoints:
+            model = self.config.models[endpoint.model]
+            ctx = {
+                **context,
+                'endpoint': endpoint,
+                # Endpoints on the same model get their own classes, named after the resource
+                'class_name': resource_class_name(endpoint.resource),
+                'model': model,
+                # The belongs-to relations the resource renders, one per foreign key
+                'relations': [
+                    relation_name(field_name) for field_name, field in model.fields.items() if field.foreign_key
+                ],
+                'filters': [
+                    {'name': name, 'boolean': model.fields[name].type == 'boolean'}
+                    for name in endpoint.filters or [] if name in model.fields
+                ],
+                'sorts': endpoint.sort_fields or [],
+            }
+            content = self.render_template('backend/laravel/Query.php.j2', ctx)
+            self.write_file(f'app/Queries/{ctx["class_name"]}Query.php', content)
+    
     def _generate_requests(self):
         """Generate form request validators."""
         context = self.get_context()
@@ -89,15 +118,31 @@ class LaravelGenerator(CodeGenerator):
         context = self.get_context()
         
         for i, (model_name, model_config) in enumerate(self.config.models.items()):
-            ctx = {**context, 'model_name': model_name, 'model': model_config}
+            ctx = {
+                **context,
+                'model_name': model_name,
+                'model': model_config,
+                'indexes': model_indexes(self.config, model_name),
+            }
             content = self.render_template('backend/laravel/migration.php.j2', ctx)
             
             timestamp = f"2024_01_01_{str(i).zfill(6)}"
             table_name = model_config.table_name or model_name.lower() + 's'
             self.write_file(f'database/migrations/{timestamp}_create_{table_name}_table.php', content)
+        
+        self.write_file('index_report.md', format_index_report(self.config))
     
     def _generate_env_example(self):
         """Generate .env.example."""
         context = self.get_context()
         content = self.render_template('backend/laravel/.env.example.j2', context)
         self.write_file('.env.example', content)
+    
+    def _generate_octane(self):
+        """Generate the Octane worker configuration and a start script that warms the caches."""
+        context = {**self.get_context(), 'laravel': self.config.laravel}
+        content = self.render_template('backend/laravel/octane.php.j2', context)
+        self.write_file('config/octane.php', content)
+    
+        content = self.render_template('backend/laravel/start-octane.sh.j2', context)
+        self.write_file('scripts/start-octane.sh', content)
@@ -1,6 +1,17 @@
 """Spring Boot backend generator."""
 
 from adipose.core.generator import CodeGenerator
+from adipose.core.indexes import model_indexes, format_index_report
+from adipose.utils.helpers import relation_name, resource_class_name, to_camel_case, type_mapping
+
+
+# Imports needed by the Java types that type_mapping produces
+JAVA_TYPE_IMPORTS = {
+    'LocalDateTime': 'java.time.LocalDateTime',
+    'LocalDate': 'java.time.LocalDate',
+    'List<Object>': 'java.util.List',
+    'JsonNode': 'com.fasterxml.jackson.databind.JsonNode',
+}
 
 
 class SpringBootGenerator(CodeGenerator):
@@ -14,11 +25,15 @@ class SpringBootGenerator(CodeGenerator):
         self._generate_application()
         self._generate_entities()
         self._generate_repositories()
+        if self.config.springboot.entity_graphs:
+            self._generate_fetch_repositories()
         self._generate_services()
         self._generate_controllers()
         self._generate_dtos()
+        self._generate_views()
         self._generate_security()
         self._generate_application_properties()
+        self._generate_persistence_tuning()
         
         print("\n=== Spring Boot Backend Generation Complete ===\n")
     
@@ -41,9 +56,16 @@ class SpringBootGenerator(CodeGenerator):
         package_path = 'src/main/java/com/example/' + self.config.project.name.lower()
         
         for model_name, model_config in self.config.models.items():
-            ctx = {**context, 'model_name': model_name, 'model': model_config}
+            ctx = {
+                **context,
+                'model_name': model_name,
+                'model': model_config,
+                'indexes': model_indexes(self.config, model_name),
+            }
             content = self.render_template('backend/springboot/Entity.java.j2', ctx)
             self.write_file(f'{package_path}/entity/{model_name}.java', content)
+        
+        self.write_file('index_report.md', format_index_report(self.config))
     
     def _generate_repositories(self):
         """Generate JPA repositories."""
@@ -55,6 +77,29 @@ class SpringBootGenerator(CodeGenerator):
             content = self.render_template('backend/springboot/Repository.java.j2', ctx)
             self.write_file(f'{package_path}/repository/{model_name}Repository.java', content)
     
+    def _generate_fetch_repositories(self):
+        """Generate repositories loading each model's foreign-key relations through entity graphs."""
+        context = self.get_context()
+        package = 'com.example.' + self.config.project.name.lower()
+        package_path = 'src/main/java/' + package.replace('.', '/')
+        
+        for model_name, model_config in self.config.models.items():
+            relations = [
+                relation_name(field_name)
+                for field_name, field in model_config.fields.items() if field.foreign_key
+            ]
+            if not relations:
+                continue
+            ctx = {
+                **context,
+                'package': package,
+                'model_name': model_name,
+                'relations': relations,
+                'id_type': self._id_type(model_name),
+            }
+            content = self.render_template('backend/springboot/FetchRepository.java.j2', ctx)
+            self.write_file(f'{package_path}/repository/{model_name}FetchRepository.java', content)
+    
     def _generate_services(self):
         """Generate service layer."""
         context = self.get_context()
@@ -85,6 +130,74 @@ class SpringBootGenerator(CodeGenerator):
             content = self.render_template('backend/springboot/Dto.java.j2', ctx)
             self.write_file(f'{package_path}/dto/{model_name}Dto.java', content)
     
+    def _id_type(self, model_name):
+        """Get the Java type of a model's primary key."""
+        id_field = self.config.models[model_name].fields.get('id')
+        return type_mapping(id_field.type, 'java') if id_field else 'Long'
+    
+    def _view_components(self, model_name):
+        """Get the (name, type, JPQL path) of every column a model's view selects."""
+        model = self.config.models[model_name]
+        components = {'id': {'name': 'id', 'type': self._id_type(model_name), 'path': 'e.id'}}
+        for field_name, field in model.fields.items():
+            if field_name == 'id':
+                continue
+            if field.foreign_key:
+                relation = relation_name(field_name)
+                components[field_name] = {
+                    'name': relation + 'Id',
+                    'type': self._id_type(field.foreign_key),
+                    'path': f'e.{relation}.id',
+                }
+            else:
+                name = to_camel_case(field_name)
+                components[field_name] = {
+                    'name': name, 'type': type_mapping(field.type, 'java'), 'path': f'e.{name}',
+                }
+        if model.timestamps:
+            for field_name in ('created_at', 'updated_at'):
+                name = to_camel_case(field_name)
+                components[field_name] = {'name': name, 'type': 'LocalDateTime', 'path': f'e.{name}'}
+        return components
+    
+    def _generate_views(self):
+        """Generate DTO projections and the repositories that list and read them."""
+        context = self.get_context()
+        package = 'com.example.' + self.config.project.name.lower()
+        package_path = 'src/main/java/' + package.replace('.', '/')
+        
+        # A view depends only on its model; repositories carry each endpoint's
+        # filters, so they are named after the resource to keep endpoints apart
+        viewed = set()
+        for endpoint in self.config.endpoints:
+            if 'list' not in endpoint.operations and 'read' not in endpoint.operations:
+                continue
+            components = self._view_components(endpoint.model)
+            filters = [components[name] for name in endpoint.filters or [] if name in components]
+            ctx = {
+                **context,
+                'package': package,
+                'endpoint': endpoint,
+                'class_name': resource_class_name(endpoint.resource),
+                'model_name': endpoint.model,
+                'soft_delete': self.config.models[endpoint.model].soft_delete,
+                'id_type': self._id_type(endpoint.model),
+                'components': list(components.values()),
+                'filters': filters,
+            }
+            
+            if endpoint.model not in viewed:
+                viewed.add(endpoint.model)
+                types = {component['type'] for component in components.values()}
+                imports = sorted(JAVA_TYPE_IMPORTS[t] for t in types if t in JAVA_TYPE_IMPORTS)
+                content = self.render_template('backend/springboot/View.java.j2', {**ctx, 'imports': imports})
+                self.write_file(f'{package_path}/dto/{endpoint.model}View.java', content)
+            
+            types = {component['type'] for component in filters}
+            imports = sorted(JAVA_TYPE_IMPORTS[t] for t in types if t in JAVA_TYPE_IMPORTS)
+            content = self.render_template('backend/springboot/ViewRepository.java.j2', {**ctx, 'imports': imports})
+            self.write_file(f'{package_path}/repository/{ctx["class_name"]}ViewRepository.java', content)
+    
     def _generate_security(self):
         """Generate security configuration."""
         context = self.get_context()
@@ -101,3 +214,25 @@ class SpringBootGenerator(CodeGenerator):
         context = self.get_context()
         content = self.render_template('backend/springboot/application.properties.j2', context)
         self.write_file('src/main/resources/application.properties', content)
+    
+    def _generate_persistence_tuning(self):
+        """Generate JDBC batching and second-level cache settings layered over application.properties."""
+        springboot = self.config.springboot
+        cached_models = [name for name, model in self.config.models.items() if model.cacheable]
+        if not springboot.jdbc_batch_size and not cached_models:
+            return
+        
+        context = {
+            **self.get_context(),
+            'springboot': springboot,
+            'package': 'com.example.' + self.config.project.name.lower(),
+            'cached_models': cached_models,
+        }
+        content = self.render_template('backend/springboot/performance.properties.j2', context)
+        self.write_file('src/main/resources/config/application.properties', content)
+        
+        if cached_models:
+            content = self.render_template('backend/springboot/ehcache.xml.j2', context)
+            self.write_file('src/main/resources/ehcache.xml', content)
+            content = self.render_template('backend/springboot/orm.xml.j2', context)
+            self.write_file('src/main/resources/META-INF/orm.xml', content)
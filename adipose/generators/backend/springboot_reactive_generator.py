@@ -0,0 +1,203 @@
+"""Reactive Spring Boot (WebFlux + R2DBC) backend generator."""
+
+import json
+
+from adipose.core.generator import CodeGenerator
+from adipose.core.indexes import model_indexes, format_index_report, get_table_name
+from adipose.utils.helpers import model_dependency_order, to_camel_case, type_mapping
+
+
+# R2DBC URL scheme per database; the others have no R2DBC driver
+R2DBC_SCHEMES = {
+    'postgresql': 'postgresql',
+    'mysql': 'mysql',
+    'sqlserver': 'mssql',
+}
+
+# Column types for schema.sql (PostgreSQL); JSON and arrays are kept as text
+POSTGRES_COLUMN_TYPES = {
+    'string': 'varchar',
+    'text': 'text',
+    'integer': 'integer',
+    'float': 'double precision',
+    'boolean': 'boolean',
+    'datetime': 'timestamp',
+    'date': 'date',
+    'json': 'text',
+    'array': 'text',
+}
+
+
+class ReactiveSpringBootGenerator(CodeGenerator):
+    """Generate a reactive Spring Boot backend on WebFlux and R2DBC."""
+    
+    def generate(self):
+        """Generate reactive Spring Boot backend code."""
+        if self.config.database.type not in R2DBC_SCHEMES:
+            raise ValueError(
+                f"the reactive Spring Boot backend needs an R2DBC database "
+                f"({', '.join(R2DBC_SCHEMES)}), not {self.config.database.type}"
+            )
+    
+        print("\n=== Generating Reactive Spring Boot Backend ===\n")
+    
+        self._generate_pom()
+        self._generate_application()
+        self._generate_entities()
+        self._generate_repositories()
+        self._generate_controllers()
+        self._generate_security()
+        self._generate_application_properties()
+        if self.config.database.migrations and self.config.database.type == 'postgresql':
+            self._generate_schema()
+    
+        print("\n=== Reactive Spring Boot Backend Generation Complete ===\n")
+    
+    @property
+    def package(self) -> str:
+        """Java package of the generated code."""
+        return 'com.example.' + self.config.project.name.lower()
+    
+    @property
+    def package_path(self) -> str:
+        """Source directory of the generated package."""
+        return 'src/main/java/' + self.package.replace('.', '/')
+    
+    def get_context(self):
+        """Get template context with the package and per-model column details."""
+        return {
+            **super().get_context(),
+            'package': self.package,
+            'r2dbc_scheme': R2DBC_SCHEMES[self.config.database.type],
+            'columns': {model_name: self._columns(model_name) for model_name in self.config.models},
+            'tables': {model_name: get_table_name(self.config, model_name) for model_name in self.config.models},
+        }
+    
+    def _java_type(self, field_type: str) -> str:
+        """Map a field type to the Java type R2DBC reads it into."""
+        if field_type.lower() in ('json', 'array'):
+            return 'String'
+        return type_mapping(field_type, 'java')
+    
+    def _columns(self, model_name: str):
+        """Describe every column of a model: property, Java type, validation and default."""
+        model = self.config.models[model_name]
+        id_field = model.fields.get('id')
+        columns = [{
+            'name': 'id', 'column': 'id', 'property': 'id',
+            'type': self._java_type(id_field.type) if id_field else 'Long',
+            'constraints': [], 'default': None, 'writable': False,
+        }]
+        for field_name, field in model.fields.items():
+            if field_name == 'id':
+                continue
+            java_type = self._java_type(field.type)
+            constraints = []
+            if field.required and field.default is None and not field.nullable:
+                constraints.append('@NotNull')
+            if field.min_length is not None or field.max_length is not None:
+                bounds = [f'{key} = {value}' for key, value in
+                          (('min', field.min_length), ('max', field.max_length)) if value is not None]
+                constraints.append(f"@Size({', '.join(bounds)})")
+            if field.min_value is not None:
+                constraints.append(f'@DecimalMin("{field.min_value:g}")')
+            if field.max_value is not None:
+                constraints.append(f'@DecimalMax("{field.max_value:g}")')
+            if field.pattern:
+                constraints.append(f"@Pattern(regexp = {json.dumps(field.pattern.replace('(?P<', '(?<'))})")
+            default = None
+            if field.default is not None and java_type in ('Boolean', 'Integer', 'Double', 'String'):
+                if java_type == 'Boolean':
+                    default = 'true' if field.default else 'false'
+                elif java_type == 'Double':
+                    default = repr(float(field.default))
+                elif java_type == 'Integer':
+                    default = str(int(field.default))
+                else:
+                    default = json.dumps(str(field.default))
+            columns.append({
+                'name': field_name, 'column': field_name, 'property': to_camel_case(field_name),
+                'type': java_type, 'constraints': constraints, 'default': default, 'writable': True,
+                'field': field,
+            })
+        implicit = (['created_at', 'updated_at'] if model.timestamps else []) + (
+            ['deleted_at'] if model.soft_delete else [])
+        for field_name in implicit:
+            columns.append({
+                'name': field_name, 'column': field_name, 'property': to_camel_case(field_name),
+                'type': 'LocalDateTime', 'constraints': [], 'default': None, 'writable': False,
+            })
+        return columns
+    
+    def _generate_pom(self):
+        """Generate pom.xml."""
+        context = self.get_context()
+        content = self.render_template('backend/springboot_reactive/pom.xml.j2', context)
+        self.write_file('pom.xml', content)
+    
+    def _generate_application(self):
+        """Generate the main application class."""
+        context = self.get_context()
+        content = self.render_template('backend/springboot_reactive/Application.java.j2', context)
+        self.write_file(f'{self.package_path}/Application.java', content)
+    
+    def _generate_entities(self):
+        """Generate R2DBC entities."""
+        context = self.get_context()
+        for model_name, model_config in self.config.models.items():
+            ctx = {**context, 'model_name': model_name, 'model': model_config}
+            content = self.render_template('backend/springboot_reactive/Entity.java.j2', ctx)
+            self.write_file(f'{self.package_path}/entity/{model_name}.java', content)
+    
+        self.write_file('index_report.md', format_index_report(self.config))
+    
+    def _generate_repositories(self):
+        """Generate R2DBC repositories."""
+        context = self.get_context()
+        for model_name, model_config in self.config.models.items():
+            ctx = {**context, 'model_name': model_name, 'model': model_config}
+            content = self.render_template('backend/springboot_reactive/Repository.java.j2', ctx)
+            self.write_file(f'{self.package_path}/repository/{model_name}Repository.java', content)
+    
+    def _generate_controllers(self):
+        """Generate WebFlux controllers."""
+        context = self.get_context()
+        for endpoint in self.config.endpoints:
+            columns = {column['name']: column for column in context['columns'][endpoint.model]}
+            ctx = {
+                **context,
+                'endpoint': endpoint,
+                'model': self.config.models[endpoint.model],
+                'filters': [columns[name] for name in endpoint.filters or [] if name in columns],
+                'sorts': [columns[name] for name in endpoint.sort_fields or [] if name in columns],
+            }
+            content = self.render_template('backend/springboot_reactive/Controller.java.j2', ctx)
+            self.write_file(f'{self.package_path}/controller/{endpoint.model}Controller.java', content)
+    
+    def _generate_security(self):
+        """Generate the reactive security chain and JWT filter."""
+        context = self.get_context()
+        content = self.render_template('backend/springboot_reactive/SecurityConfig.java.j2', context)
+        self.write_file(f'{self.package_path}/config/SecurityConfig.java', content)
+    
+        if self.config.auth.type == 'jwt':
+            content = self.render_template('backend/springboot_reactive/JwtAuthenticationFilter.java.j2', context)
+            self.write_file(f'{self.package_path}/security/JwtAuthenticationFilter.java', content)
+    
+    def _generate_application_properties(self):
+        """Generate application.properties."""
+        context = self.get_context()
+        content = self.render_template('backend/springboot_reactive/application.properties.j2', context)
+        self.write_file('src/main/resources/application.properties', content)
+    
+    def _generate_schema(self):
+        """Generate an idempotent schema.sql with the derived indexes (PostgreSQL)."""
+        context = {
+            **self.get_context(),
+            'column_types': POSTGRES_COLUMN_TYPES,
+            # Referenced tables are created before the tables that reference them
+            'model_order': model_dependency_order(self.config.models),
+            'indexes': {model_name: model_indexes(self.config, model_name) for model_name in self.config.models},
+        }
+        content = self.render_template('backend/springboot_reactive/schema.sql.j2', context)
+        self.write_file('src/main/resources/schema.sql', content)
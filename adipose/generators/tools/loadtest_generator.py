@@ -0,0 +1,104 @@
+"""Load-test harness generator."""
+
+import json
+from typing import Any, Dict, Optional
+
+from adipose.core.generator import CodeGenerator
+from adipose.schemas.config import APIConfig
+from adipose.utils.helpers import (
+    generate_field_example, get_endpoint_path, get_http_method, model_dependency_order
+)
+
+
+# Backends whose routers expect a trailing slash on every path
+TRAILING_SLASH_BACKENDS = ('django',)
+
+
+class LoadTestGenerator(CodeGenerator):
+    """Generate a dependency-free load-test harness for the configured endpoints."""
+
+    def __init__(self, config: APIConfig, output_dir: str, backend: Optional[str] = None):
+        """Initialize load-test generator.
+
+        Args:
+            config: API configuration
+            output_dir: Output directory for generated code
+            backend: Backend the harness targets, used to shape request paths
+        """
+        super().__init__(config, output_dir)
+        self.backend = backend
+
+    def generate(self):
+        """Generate load-test harness."""
+        print("\n=== Generating Load Test Harness ===\n")
+
+        self._generate_scenarios()
+        self._generate_runner()
+        if self.config.performance.binary_formats:
+            self._generate_codec_benchmark()
+
+        print("\n=== Load Test Harness Generation Complete ===\n")
+
+    def _generate_scenarios(self):
+        """Generate scenarios.json describing payloads and operations."""
+        scenarios = {
+            'project': self.config.project.name,
+            'backend': self.backend,
+            'order': model_dependency_order(self.config.models),
+            'models': {
+                model_name: self._model_payload(model_name)
+                for model_name in self.config.models
+            },
+            'endpoints': [
+                {
+                    'resource': endpoint.resource,
+                    'model': endpoint.model,
+                    'auth_required': endpoint.auth_required,
+                    'operations': [
+                        {
+                            'name': operation,
+                            'method': get_http_method(operation),
+                            'path': self._path(endpoint.resource, operation),
+                        }
+                        for operation in endpoint.operations
+                    ],
+                }
+                for endpoint in self.config.endpoints
+            ],
+        }
+        self.write_file('scenarios.json', json.dumps(scenarios, indent=2) + '\n')
+
+    def _generate_runner(self):
+        """Generate the load-test runner."""
+        context = self.get_context()
+        content = self.render_template('loadtest/run.py.j2', {**context, 'loadtest': self.config.loadtest})
+        self.write_file('run.py', content)
+
+    def _generate_codec_benchmark(self):
+        """Generate the payload-size and decode-time benchmark for the binary encodings."""
+        context = self.get_context()
+        content = self.render_template('loadtest/bench_codecs.py.j2', context)
+        self.write_file('bench_codecs.py', content)
+
+    def _model_payload(self, model_name: str) -> Dict[str, Dict[str, Any]]:
+        """Describe the request body used to create or update a model."""
+        model = self.config.models[model_name]
+        implicit = ('created_at', 'updated_at') if model.timestamps else ()
+        payload = {}
+        for field_name, field in model.fields.items():
+            if field_name == 'id' or field_name in implicit:
+                continue
+            payload[field_name] = {
+                'value': generate_field_example(field),
+                'unique': field.unique,
+                'max_length': field.max_length,
+                'foreign_key': field.foreign_key,
+            }
+        return payload
+
+    def _path(self, resource: str, operation: str) -> str:
+        """Build the request path for an operation, with {id} left as a placeholder."""
+        path = get_endpoint_path(resource, operation)
+        if self.backend in TRAILING_SLASH_BACKENDS:
+            path += '/'
+        return path
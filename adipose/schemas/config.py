@@ -1,7 +1,7 @@
 """Configuration schema for Adipose API generator."""
 
 from typing import Dict, List, Optional, Literal, Any
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 
 class ProjectConfig(BaseModel):
@@ -50,6 +50,18 @@ class FieldConfig(BaseModel):
     index: bool = Field(default=False, description="Whether to create database index")
 
 
+class PartitionConfig(BaseModel):
+    """Declarative table partitioning (PostgreSQL)."""
+    strategy: Literal["range", "hash"] = Field(default="range", description="Partitioning strategy")
+    key: str = Field(default="created_at", description="Partition key column")
+    interval: Literal["day", "month"] = Field(default="month", description="Size of each range partition")
+    premake: int = Field(default=3, description="Future range partitions created ahead of time")
+    retention: Optional[int] = Field(
+        default=None, description="Past range partitions kept before older ones are detached (None keeps all)"
+    )
+    partitions: int = Field(default=8, description="Number of hash partitions")
+
+
 class ModelConfig(BaseModel):
     """Data model configuration."""
     fields: Dict[str, Any] = Field(..., description="Model fields")
@@ -57,6 +69,10 @@ class ModelConfig(BaseModel):
     description: Optional[str] = Field(None, description="Model description")
     timestamps: bool = Field(default=True, description="Add created_at/updated_at fields")
     soft_delete: bool = Field(default=False, description="Enable soft delete")
+    partition_by: Optional[PartitionConfig] = Field(None, description="Partition the table (PostgreSQL)")
+    cacheable: bool = Field(
+        default=False, description="Keep rows in the ORM's second-level cache (Spring Boot)"
+    )
     
     @field_validator("fields", mode="before")
     @classmethod
@@ -75,13 +91,34 @@ class ModelConfig(BaseModel):
                     parsed[field_name] = field_def
             return parsed
         return v
+    
+    @model_validator(mode="after")
+    def check_partition_key(self):
+        """Ensure the partition key can be part of every unique constraint."""
+        partition = self.partition_by
+        if partition is None:
+            return self
+        key = partition.key
+        if partition.strategy == "range":
+            if key in ("created_at", "updated_at") and key not in self.fields:
+                if not self.timestamps:
+                    raise ValueError(f"partition key '{key}' requires timestamps: true")
+            elif key not in self.fields or self.fields[key].type != "datetime" or not self.fields[key].required:
+                raise ValueError(f"range partition key '{key}' must be a required datetime field or created_at")
+        elif key != "id" and key not in self.fields:
+            raise ValueError(f"hash partition key '{key}' is not a field")
+        # PostgreSQL unique constraints on a partitioned table must include the partition key
+        unique = [name for name, field in self.fields.items() if field.unique and name not in ("id", key)]
+        if unique:
+            raise ValueError(f"partitioned models cannot have unique fields: {', '.join(unique)}")
+        return self
 
 
 class EndpointConfig(BaseModel):
     """API endpoint configuration."""
     resource: str = Field(..., description="Resource name (e.g., 'users')")
     model: str = Field(..., description="Associated model name")
-    operations: List[Literal["create", "read", "update", "delete", "list", "search"]] = Field(
+    operations: List[Literal["create", "read", "update", "delete", "list", "search", "export", "changes"]] = Field(
         default=["list", "read", "create", "update", "delete"],
         description="Allowed operations"
     )
@@ -93,8 +130,50 @@ class EndpointConfig(BaseModel):
     pagination: bool = Field(default=True, description="Enable pagination for list operations")
     page_size: int = Field(default=20, description="Default page size")
     max_page_size: int = Field(default=100, description="Maximum page size")
+    pagination_mode: Literal["page", "slice", "cursor"] = Field(
+        default="page",
+        description=(
+            "'page' reports the total count; 'slice' skips the count query and reports has_next; "
+            "'cursor' pages by keyset on (sort field, id) (Laravel; other backends use 'page')"
+        ),
+    )
     filters: Optional[List[str]] = Field(default=None, description="Fields that can be filtered")
     sort_fields: Optional[List[str]] = Field(default=None, description="Fields that can be sorted")
+    filter_sort_indexes: bool = Field(
+        default=False, description="Also index each filter followed by each sort field (one index per pair)"
+    )
+    sparse_fieldsets: bool = Field(
+        default=True, description="Allow read/list requests to select a subset of fields via ?fields="
+    )
+    export_chunk_size: int = Field(
+        default=2000, description="Rows fetched per database round trip by the export operation"
+    )
+    changes_page_size: int = Field(
+        default=500, description="Maximum records per response of the changes (delta sync) operation"
+    )
+    cache_seconds: int = Field(
+        default=0,
+        description="Seconds read and list responses are served from the output cache (0 disables it; public endpoints only)"
+    )
+
+    @model_validator(mode="after")
+    def check_cache(self):
+        """The output cache never stores responses to requests that carry credentials."""
+        if self.cache_seconds and self.auth_required:
+            raise ValueError(
+                f"cache_seconds on /{self.resource} has no effect: authenticated requests bypass "
+                "the output cache; set auth_required: false or drop cache_seconds"
+            )
+        return self
+
+
+class ReplicaConfig(BaseModel):
+    """Read replica of the primary database."""
+    host_env: str = Field(..., description="Environment variable for replica host")
+    port_env: Optional[str] = Field(
+        default=None, description="Environment variable for replica port (defaults to the primary's)"
+    )
+    weight: int = Field(default=1, description="Relative share of reads sent to this replica")
 
 
 class DatabaseConfig(BaseModel):
@@ -108,6 +187,10 @@ class DatabaseConfig(BaseModel):
     user_env: str = Field(default="DB_USER", description="Environment variable for database user")
     password_env: str = Field(default="DB_PASSWORD", description="Environment variable for database password")
     migrations: bool = Field(default=True, description="Generate database migrations")
+    replicas: List[ReplicaConfig] = Field(default_factory=list, description="Read replicas")
+    sticky_seconds: int = Field(
+        default=5, description="Seconds a client keeps reading from the primary after a write"
+    )
 
 
 class ErrorHandlingConfig(BaseModel):
@@ -133,6 +216,158 @@ class CorsConfig(BaseModel):
     max_age: int = Field(default=3600, description="Preflight cache duration in seconds")
 
 
+class PerformanceConfig(BaseModel):
+    """Production performance profile for generated backends."""
+    persistent_connections: bool = Field(
+        default=False, description="Reuse database connections across requests"
+    )
+    conn_max_age: int = Field(default=600, description="Persistent connection lifetime in seconds")
+    connection_pool: bool = Field(
+        default=False, description="Use driver-level connection pooling where the database supports it"
+    )
+    pool_min_size: int = Field(default=2, description="Minimum pooled connections per process")
+    pool_max_size: int = Field(default=10, description="Maximum pooled connections per process")
+    compression: bool = Field(default=False, description="Compress responses above compression_min_size")
+    compression_min_size: int = Field(default=1024, description="Minimum response size in bytes to compress")
+    brotli: bool = Field(default=True, description="Prefer Brotli over gzip when the client accepts it")
+    fast_json: bool = Field(default=False, description="Use a fast JSON renderer and parser")
+    binary_formats: List[Literal["msgpack", "cbor"]] = Field(
+        default=[], description="Binary encodings negotiated alongside JSON via Accept and Content-Type"
+    )
+    cors_preflight_short_circuit: bool = Field(
+        default=False, description="Answer CORS preflight requests without running the view"
+    )
+    cached_templates: bool = Field(default=False, description="Use cached template loaders")
+
+
+class MetricsConfig(BaseModel):
+    """Request and database metrics exposed in Prometheus text format."""
+    enabled: bool = Field(default=False, description="Instrument requests and expose a metrics endpoint")
+    path: str = Field(default="/metrics", description="Path of the Prometheus scrape endpoint")
+    duration_buckets: List[float] = Field(
+        default=[0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0],
+        description="Request and database duration histogram buckets in seconds"
+    )
+    size_buckets: List[int] = Field(
+        default=[100, 1000, 10000, 100000, 1000000],
+        description="Response size histogram buckets in bytes"
+    )
+    db_metrics: bool = Field(default=True, description="Record database query count and time per request")
+
+
+class DjangoConfig(BaseModel):
+    """Django backend generation options."""
+    asgi: bool = Field(
+        default=False, description="Generate an ASGI project with async views, ORM calls and middleware"
+    )
+    tombstone_retention_days: int = Field(
+        default=30,
+        description="Days soft-deleted rows are kept before purge_deleted removes them; older sync tokens expire"
+    )
+
+
+class ExpressConfig(BaseModel):
+    """Express backend generation options."""
+    cluster: bool = Field(
+        default=False, description="Run one worker process per core behind a cluster primary"
+    )
+    workers: Optional[int] = Field(
+        default=None, description="Worker processes (defaults to the number of available cores)"
+    )
+    shutdown_timeout: int = Field(
+        default=30, description="Seconds a worker may spend draining connections before it is killed"
+    )
+    health_port: int = Field(
+        default=9090, description="Port of the cluster primary's per-worker health endpoint"
+    )
+    compiled_schemas: bool = Field(
+        default=False, description="Generate per-model validators and JSON serializers compiled from the field rules"
+    )
+    data_layer: bool = Field(
+        default=False,
+        description="Generate a pooled PostgreSQL data layer with named prepared statements per endpoint query",
+    )
+
+
+class SpringBootConfig(BaseModel):
+    """Spring Boot backend generation options."""
+    jdbc_batch_size: int = Field(
+        default=0, description="Statements Hibernate sends per JDBC batch (0 disables batching)"
+    )
+    order_writes: bool = Field(
+        default=True, description="Group batched inserts and updates by entity so more of them share a batch"
+    )
+    cache_ttl: int = Field(
+        default=600, description="Seconds a cacheable model's rows stay in the second-level cache"
+    )
+    cache_max_entries: int = Field(
+        default=10000, description="Rows kept per cacheable model's second-level cache region"
+    )
+    entity_graphs: bool = Field(
+        default=False, description="Generate repositories fetching foreign-key relations with entity graphs"
+    )
+
+
+class DotNetConfig(BaseModel):
+    """ASP.NET Core backend generation options."""
+    compiled_queries: bool = Field(
+        default=False, description="Generate no-tracking EF Core compiled queries for each endpoint's read and list shapes"
+    )
+    source_generated_json: bool = Field(
+        default=False, description="Serialize DTOs and entities through a System.Text.Json source-generated context"
+    )
+    db_context_pool_size: int = Field(
+        default=0, description="DbContext instances kept for reuse across requests (0 disables pooling)"
+    )
+    minimal_api: bool = Field(
+        default=False, description="Generate minimal-API endpoint groups instead of MVC controllers"
+    )
+    aot: bool = Field(
+        default=False,
+        description="Publish ReadyToRun-precompiled and partially trimmed (requires minimal_api); not Native AOT, "
+                    "which EF Core does not support"
+    )
+
+    @model_validator(mode="after")
+    def check_aot(self):
+        """Trimmed publishing cannot keep what MVC controllers discover through reflection."""
+        if self.aot and not self.minimal_api:
+            raise ValueError("dotnet.aot requires dotnet.minimal_api: MVC controllers are not trim-compatible")
+        return self
+
+
+class LaravelConfig(BaseModel):
+    """Laravel backend generation options."""
+    octane: bool = Field(
+        default=False, description="Serve from long-lived Octane workers instead of booting per request"
+    )
+    octane_server: Literal["swoole", "roadrunner", "frankenphp"] = Field(
+        default="swoole", description="Application server the Octane workers run on"
+    )
+    octane_workers: int = Field(default=0, description="Octane workers (0 starts one per CPU)")
+    octane_max_requests: int = Field(
+        default=500, description="Requests a worker serves before it is replaced, bounding leaked memory"
+    )
+
+
+class LoadTestConfig(BaseModel):
+    """Generated load-test harness configuration."""
+    base_url: str = Field(default="http://localhost:8000/api", description="API root the harness targets")
+    concurrency: int = Field(default=10, description="Concurrent client connections per scenario")
+    duration: float = Field(default=30, description="Measured seconds per endpoint operation")
+    warmup: float = Field(default=5, description="Unmeasured seconds before each measurement")
+    timeout: float = Field(default=10, description="Per-request timeout in seconds")
+    seed_records: int = Field(default=50, description="Records created per model before measuring")
+
+
+class TestingConfig(BaseModel):
+    """Generated test suite options."""
+    query_count_tests: bool = Field(
+        default=False, description="Generate tests asserting per-endpoint database query counts"
+    )
+    fixture_rows: int = Field(default=5, description="Rows created per model for the generated tests")
+
+
 class APIConfig(BaseModel):
     """Complete API configuration."""
     project: ProjectConfig = Field(..., description="Project configuration")
@@ -146,6 +381,19 @@ class APIConfig(BaseModel):
         default_factory=ErrorHandlingConfig, description="Error handling configuration"
     )
     cors: CorsConfig = Field(default_factory=CorsConfig, description="CORS configuration")
+    performance: PerformanceConfig = Field(
+        default_factory=PerformanceConfig, description="Performance profile"
+    )
+    metrics: MetricsConfig = Field(default_factory=MetricsConfig, description="Metrics configuration")
+    django: DjangoConfig = Field(default_factory=DjangoConfig, description="Django backend options")
+    express: ExpressConfig = Field(default_factory=ExpressConfig, description="Express backend options")
+    springboot: SpringBootConfig = Field(
+        default_factory=SpringBootConfig, description="Spring Boot backend options"
+    )
+    dotnet: DotNetConfig = Field(default_factory=DotNetConfig, description="ASP.NET Core backend options")
+    laravel: LaravelConfig = Field(default_factory=LaravelConfig, description="Laravel backend options")
+    loadtest: LoadTestConfig = Field(default_factory=LoadTestConfig, description="Load-test harness options")
+    testing: TestingConfig = Field(default_factory=TestingConfig, description="Generated test options")
     
     @field_validator("models", mode="before")
     @classmethod
@@ -160,3 +408,15 @@ class APIConfig(BaseModel):
                     parsed[model_name] = model_def
             return parsed
         return v
+    
+    @model_validator(mode="after")
+    def check_changes_models(self):
+        """Ensure delta sync can see every change, including deletions."""
+        for endpoint in self.endpoints:
+            model = self.models.get(endpoint.model)
+            if "changes" in endpoint.operations and model and not (model.timestamps and model.soft_delete):
+                raise ValueError(
+                    f"endpoint '{endpoint.resource}': the changes operation requires "
+                    f"timestamps: true and soft_delete: true on {endpoint.model}"
+                )
+        return self
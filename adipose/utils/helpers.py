@@ -1,8 +1,9 @@
 """Utility functions for Adipose."""
 
 import re
+import hashlib
 import inflection
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 
 
 def to_snake_case(name: str) -> str:
@@ -25,6 +26,18 @@ def to_kebab_case(name: str) -> str:
     return inflection.dasherize(inflection.underscore(name))
 
 
+def relation_name(field_name: str) -> str:
+    """Get the camelCase relation attribute a foreign-key field maps to (user_id -> user)."""
+    if field_name.endswith("_id"):
+        field_name = field_name[:-3]
+    return to_camel_case(field_name)
+
+
+def resource_class_name(resource: str) -> str:
+    """Get the PascalCase class prefix for an endpoint resource (admin-posts -> AdminPosts)."""
+    return to_pascal_case(inflection.underscore(resource))
+
+
 def pluralize(name: str) -> str:
     """Pluralize a word."""
     return inflection.pluralize(name)
@@ -141,6 +154,8 @@ def get_http_method(operation: str) -> str:
         "update": "PUT",
         "delete": "DELETE",
         "search": "GET",
+        "export": "GET",
+        "changes": "GET",
         "patch": "PATCH",
     }
     return method_map.get(operation, "GET")
@@ -152,8 +167,8 @@ def get_endpoint_path(resource: str, operation: str, with_id: bool = False) -> s
     
     if operation in ["read", "update", "delete"]:
         return f"{base}/{{id}}"
-    elif operation == "search":
-        return f"{base}/search"
+    elif operation in ["search", "export", "changes"]:
+        return f"{base}/{operation}"
     else:
         return base
 
@@ -168,6 +183,13 @@ def sanitize_identifier(name: str) -> str:
     return sanitized
 
 
+def index_name(table: str, fields: List[str], suffix: str = "idx") -> str:
+    """Build a deterministic index name within the 30 character limit."""
+    digest = hashlib.md5("_".join([table, *fields, suffix]).encode()).hexdigest()[:6]
+    prefix = "_".join([table[:8], fields[0][:8]]) if fields else table[:17]
+    return f"{prefix}_{digest}_{suffix}"
+
+
 def generate_example_value(field_type: str) -> Any:
     """Generate example value for a field type."""
     examples = {
@@ -182,3 +204,54 @@ def generate_example_value(field_type: str) -> Any:
         "array": [],
     }
     return examples.get(field_type.lower(), None)
+
+
+def generate_field_example(field: Any, sequence: Optional[int] = None) -> Any:
+    """Generate an example value that satisfies a field's constraints.
+    
+    Args:
+        field: Field configuration
+        sequence: Number mixed into the value to keep unique fields distinct
+    """
+    value = generate_example_value(field.type)
+    if isinstance(value, str) and field.type.lower() in ("string", "text"):
+        if field.pattern and "@" in field.pattern and not re.fullmatch(field.pattern, value):
+            value = "user@example.com"
+        if sequence is not None:
+            local, at, domain = value.partition("@")
+            suffix = str(sequence)
+            if field.max_length:
+                local = local[:max(field.max_length - len(suffix) - len(at + domain), 1)]
+            value = f"{local}{suffix}{at}{domain}"
+        if field.max_length:
+            value = value[:field.max_length]
+        if field.min_length and len(value) < field.min_length:
+            value = value.ljust(field.min_length, "x")
+    elif isinstance(value, (int, float)) and not isinstance(value, bool):
+        if sequence is not None:
+            value += sequence
+        if field.min_value is not None:
+            value = max(value, type(value)(field.min_value))
+        if field.max_value is not None:
+            value = min(value, type(value)(field.max_value))
+    return value
+
+
+def model_dependency_order(models: Dict[str, Any]) -> List[str]:
+    """Order models so every model comes after the models its foreign keys reference."""
+    ordered: List[str] = []
+    visiting = set()
+
+    def visit(model_name: str):
+        if model_name in ordered or model_name in visiting or model_name not in models:
+            return
+        visiting.add(model_name)
+        for field in models[model_name].fields.values():
+            if field.foreign_key and field.foreign_key != model_name:
+                visit(field.foreign_key)
+        visiting.discard(model_name)
+        ordered.append(model_name)
+
+    for model_name in models:
+        visit(model_name)
+    return ordered
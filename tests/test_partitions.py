@@ -0,0 +1,137 @@
+"""Tests for the PostgreSQL partitioning DDL emitted into Django migrations."""
+
+import contextlib
+import io
+import os
+import subprocess
+import sys
+
+import pytest
+
+from adipose.core.partitions import initial_partitions_sql, partition_table_sql
+from adipose.generators.backend.django_generator import DjangoGenerator
+from adipose.schemas.config import APIConfig, PartitionConfig
+
+
+def make_config(database_type="postgresql"):
+    """Build a config with one range and one hash partitioned model."""
+    return APIConfig(
+        project={"name": "Shop", "base_url": "http://localhost:8000"},
+        database={"type": database_type},
+        cors={"enabled": False},
+        models={
+            "Event": {
+                "fields": {"name": "string"},
+                "partition_by": {"strategy": "range", "interval": "month", "premake": 1},
+            },
+            "Reading": {
+                "fields": {"event_id": {"type": "integer", "foreign_key": "Event"}, "value": "float"},
+                "partition_by": {"strategy": "hash", "key": "event_id", "partitions": 2},
+            },
+        },
+        endpoints=[{"resource": "events", "model": "Event"}],
+    )
+
+
+def generate(config, output):
+    """Generate the Django backend quietly and return the initial migration source."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        DjangoGenerator(config, str(output)).generate()
+    return (output / "api" / "migrations" / "0001_initial.py").read_text()
+
+
+def assert_in_order(text, fragments):
+    """Assert every fragment occurs in text, each after the previous one."""
+    position = -1
+    for fragment in fragments:
+        found = text.find(fragment, position + 1)
+        assert found > position, f"{fragment!r} missing or out of order"
+        position = found
+
+
+def test_partition_table_sql_order():
+    statements = partition_table_sql("api_reading", PartitionConfig(strategy="hash", key="event_id"))
+
+    assert statements == [
+        'ALTER TABLE "api_reading" RENAME TO "api_reading_unpartitioned"',
+        'CREATE TABLE "api_reading" (LIKE "api_reading_unpartitioned" '
+        'INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING IDENTITY) PARTITION BY HASH ("event_id")',
+        'DROP TABLE "api_reading_unpartitioned"',
+        'ALTER TABLE "api_reading" ADD PRIMARY KEY ("id", "event_id")',
+    ]
+
+
+def test_hash_partitions_cover_every_remainder():
+    statements = initial_partitions_sql("api_reading", PartitionConfig(strategy="hash", key="event_id", partitions=3))
+
+    assert statements == [
+        f'CREATE TABLE "api_reading_p{remainder}" PARTITION OF "api_reading" '
+        f'FOR VALUES WITH (MODULUS 3, REMAINDER {remainder})'
+        for remainder in range(3)
+    ]
+
+
+def test_initial_migration_partitions_each_table_after_creating_it(tmp_path):
+    migration = generate(make_config(), tmp_path)
+
+    assert_in_order(migration, [
+        "name='Event'",
+        'ALTER TABLE "api_event" RENAME TO "api_event_unpartitioned"',
+        'CREATE TABLE "api_event" (LIKE "api_event_unpartitioned"',
+        'PARTITION BY RANGE ("created_at")',
+        'DROP TABLE "api_event_unpartitioned"',
+        'ALTER TABLE "api_event" ADD PRIMARY KEY ("id", "created_at")',
+        "FOR i IN 0..1 LOOP",
+        "name='Reading'",
+        'ALTER TABLE "api_reading" RENAME TO "api_reading_unpartitioned"',
+        'PARTITION BY HASH ("event_id")',
+        'DROP TABLE "api_reading_unpartitioned"',
+        'ALTER TABLE "api_reading" ADD PRIMARY KEY ("id", "event_id")',
+        'CREATE TABLE "api_reading_p0" PARTITION OF "api_reading"',
+        'CREATE TABLE "api_reading_p1" PARTITION OF "api_reading"',
+    ])
+    # Indexes are declared on the model and deferred, so they build on the partitioned table
+    assert "CREATE INDEX" not in migration
+
+
+def test_partitioning_is_skipped_outside_postgresql(tmp_path):
+    migration = generate(make_config("sqlite"), tmp_path)
+
+    assert "PARTITION BY" not in migration
+    assert "RunSQL" not in migration
+
+
+@pytest.mark.skipif(
+    not os.getenv("ADIPOSE_TEST_PG_HOST"),
+    reason="set ADIPOSE_TEST_PG_HOST (and ADIPOSE_TEST_PG_USER/_PASSWORD/_NAME) to run against PostgreSQL",
+)
+def test_initial_migration_applies_on_postgresql(tmp_path):
+    generate(make_config(), tmp_path)
+    env = dict(
+        os.environ,
+        DJANGO_SETTINGS_MODULE="Shop.settings",
+        DB_HOST=os.environ["ADIPOSE_TEST_PG_HOST"],
+        DB_USER=os.getenv("ADIPOSE_TEST_PG_USER", "postgres"),
+        DB_PASSWORD=os.getenv("ADIPOSE_TEST_PG_PASSWORD", ""),
+        DB_NAME=os.getenv("ADIPOSE_TEST_PG_NAME", "postgres"),
+    )
+    manage = [sys.executable, "manage.py"]
+    # Start from an empty schema so the initial migration runs
+    subprocess.run(manage + ["migrate", "api", "zero"], cwd=tmp_path, env=env, check=True, capture_output=True)
+    try:
+        subprocess.run(manage + ["migrate", "api"], cwd=tmp_path, env=env, check=True, capture_output=True)
+        result = subprocess.run(
+            manage + ["shell", "-c", (
+                "from django.db import connection\n"
+                "with connection.cursor() as cursor:\n"
+                "    cursor.execute(\"SELECT parent.relname, count(*) FROM pg_inherits "
+                "JOIN pg_class parent ON parent.oid = inhparent "
+                "JOIN pg_partitioned_table ON partrelid = inhparent "
+                "GROUP BY parent.relname ORDER BY parent.relname\")\n"
+                "    print(cursor.fetchall())"
+            )],
+            cwd=tmp_path, env=env, check=True, capture_output=True, text=True,
+        )
+        assert result.stdout.strip().splitlines()[-1] == "[('api_event', 2), ('api_reading', 2)]"
+    finally:
+        subprocess.run(manage + ["migrate", "api", "zero"], cwd=tmp_path, env=env, capture_output=True)